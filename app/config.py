@@ -6,6 +6,8 @@ from pydantic_settings import BaseSettings
 from pydantic import Field
 from functools import lru_cache
 
+from app.constants import DB_STATEMENT_CACHE_SIZE
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -20,6 +22,8 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = Field(..., alias="DATABASE_URL")
+    # asyncpg prepared-statement caches; must stay 0 behind a transaction pooler (Supabase/pgbouncer)
+    db_statement_cache_size: int = Field(default=DB_STATEMENT_CACHE_SIZE, alias="DB_STATEMENT_CACHE_SIZE")
     
     # Application Settings
     app_name: str = "Watchtower AI"
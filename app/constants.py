@@ -11,6 +11,8 @@ DRIFT_VARIANCE_THRESHOLD = 0.2      # 20% relative change
 
 # KS Test threshold
 DRIFT_KS_PVALUE_THRESHOLD = 0.05    # p-value threshold for statistical significance
+DRIFT_KS_EXACT_MAX_SAMPLES = 1000   # Above this sample size KS p-values use the asymptotic method
+DRIFT_BASELINE_SAMPLE_SIZE = 10000  # Sorted baseline points kept for KS when baseline stats are cached
 
 # PSI (Population Stability Index) thresholds
 DRIFT_PSI_LOW_THRESHOLD = 0.1       # Low drift
@@ -26,15 +28,19 @@ MODEL_BASED_DRIFT_THRESHOLD = 0.50  # Accuracy threshold for model-based drift
 MODEL_RF_N_ESTIMATORS = 200         # RandomForest estimators count
 MODEL_RF_RANDOM_STATE = 42          # RandomForest random seed
 MODEL_RF_TEST_SIZE = 0.2            # Test set proportion for model evaluation
+MODEL_BASED_DRIFT_MAX_SAMPLES = 50000  # Max rows per class (baseline/current) used to fit the classifier
 
 # ============ DATA QUALITY DEFAULTS ============
 QUALITY_CHECK_DUPLICATE_METHOD = "first"  # How to handle duplicates: 'first', 'last', False
 
 # ============ TIME & EXPIRATION ============
 SESSION_TOKEN_EXPIRE_HOURS = 24 * 7  # 7 days
+AUTH_CACHE_TTL_SECONDS = 30          # How long token -> company lookups are cached in-process
+AUTH_CACHE_MAX_SIZE = 10000          # Max cached tokens per cache (LRU eviction beyond this)
 
 # ============ API & TIMEOUTS ============
 API_TIMEOUT_SECONDS = 30
+MAX_DECOMPRESSED_BODY_BYTES = 256 * 1024 * 1024  # Cap on gzip-encoded request bodies after inflating
 SDK_POST_TIMEOUT_SECONDS = 30
 
 # ============ LLM CONFIGURATION ============
@@ -44,4 +50,10 @@ LLM_MAX_TOKENS = 1024
 
 # ============ DATABASE ============
 DB_ECHO_DEBUG = False               # Echo SQL queries in debug mode
-DB_STATEMENT_CACHE_SIZE = 0         # For Supabase compatibility
+DB_STATEMENT_CACHE_SIZE = 0         # Default for Supabase compatibility; override via env on direct connections
+DB_POOL_SIZE = 20                   # Persistent connections per worker
+DB_MAX_OVERFLOW = 40                # Extra connections opened under burst load
+DB_QUERY_CACHE_SIZE = 1200          # SQLAlchemy compiled-statement cache entries (default 500)
+STATS_VIEW_REFRESH_SECONDS = 300     # Refresh interval for the project statistics materialized views
+STATS_CACHE_TTL_SECONDS = 60         # How long per-project overview statistics are cached in-process
+STATS_CACHE_MAX_SIZE = 1024          # Max projects held in the statistics cache
@@ -3,11 +3,14 @@ Database connection management with async support.
 Provides session factory and dependency injection for FastAPI.
 """
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import text
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
 from typing import AsyncGenerator
+import orjson
 
 from app.config import get_settings
+from app.constants import DB_QUERY_CACHE_SIZE, DB_POOL_SIZE, DB_MAX_OVERFLOW
 
 settings = get_settings()
 
@@ -21,29 +24,36 @@ elif database_url.startswith("postgresql://"):
     database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
 
 # Fix for asyncpg requiring integer for statement_cache_size
-# If passed in URL params, it comes as a string which causes TypeError in asyncpg
-url_obj = make_url(database_url)
-connect_args = {}
-
-# Handle statement_cache_size specifically
-if "statement_cache_size" in url_obj.query:
-    # We must remove it from the URL string to avoid string-typing conflicts
-    # Reconstruct URL without this param
-    new_query = {k: v for k, v in url_obj.query.items() if k != "statement_cache_size"}
-    url_obj = url_obj._replace(query=new_query)
-    # Pass strictly as integer in connect_args
-    connect_args["statement_cache_size"] = 0
-
-# Also enforce it for Supabase transaction pooler if not present
-if "statement_cache_size" not in connect_args:
-    connect_args["statement_cache_size"] = 0
+# If passed in URL params, it comes as a string which causes TypeError in asyncpg,
+# so drop it from the URL and take the size from settings instead
+url_obj = make_url(database_url).difference_update_query(["statement_cache_size"])
+
+# Prepared-statement caches stay off (0) for the Supabase transaction pooler, which
+# can't hold server-side statements across transactions. On a direct connection
+# DB_STATEMENT_CACHE_SIZE enables both asyncpg's cache and SQLAlchemy's prepared
+# statement cache, so the hot statistics queries are parsed/planned once per connection.
+connect_args = {"statement_cache_size": settings.db_statement_cache_size}
+url_obj = url_obj.update_query_dict(
+    {"prepared_statement_cache_size": str(settings.db_statement_cache_size)}
+)
+
+
+def _json_serializer(obj) -> str:
+    """orjson for JSON columns; drift results carry numpy scalars and float quantile keys."""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
 
 # Create async engine
 engine = create_async_engine(
     url_obj,
     echo=settings.debug,
     pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
     connect_args=connect_args,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -81,6 +91,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Columns added to existing tables after their first release. create_all only
+# creates missing tables, so deployments created before these get them here.
+_ADD_MISSING_COLUMNS = [
+    """
+    ALTER TABLE feature_drift_config
+    ADD COLUMN IF NOT EXISTS model_based_drift_max_samples INTEGER NOT NULL DEFAULT 50000
+    """,
+]
+
+
 async def init_db():
     """
     Initialize database tables.
@@ -88,6 +108,8 @@ async def init_db():
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        for statement in _ADD_MISSING_COLUMNS:
+            await conn.execute(text(statement))
 
 
 async def close_db():
@@ -0,0 +1,88 @@
+"""
+Materialized views backing the project statistics endpoints.
+Created after the ORM tables on startup and refreshed periodically from the app lifespan.
+"""
+import asyncio
+from sqlalchemy import text, Table, Column, Integer, MetaData
+
+from app.database.connection import engine
+
+# Kept out of Base.metadata so create_all never tries to create them as tables
+_views_metadata = MetaData()
+
+project_overview_mv = Table(
+    "project_overview_mv",
+    _views_metadata,
+    Column("project_id", Integer, primary_key=True),
+    Column("total_tests", Integer),
+    Column("passed_tests", Integer),
+)
+
+llm_drift_mv = Table(
+    "llm_drift_mv",
+    _views_metadata,
+    Column("project_id", Integer, primary_key=True),
+    Column("total_drift_checks", Integer),
+    Column("drift_detected", Integer),
+)
+
+# A unique index per view is required for REFRESH ... CONCURRENTLY
+_CREATE_VIEWS = [
+    # Earlier deployments counted check_status = 'passed', which ingestion never
+    # writes; drop that definition so it is recreated below
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM pg_matviews
+            WHERE matviewname = 'project_overview_mv' AND definition LIKE '%''passed''%'
+        ) THEN
+            DROP MATERIALIZED VIEW project_overview_mv;
+        END IF;
+    END
+    $$
+    """,
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS project_overview_mv AS
+    SELECT project_id,
+           count(*) AS total_tests,
+           -- Ingestion records a check as 'completed' or 'failed'
+           count(*) FILTER (WHERE check_status = 'completed') AS passed_tests
+    FROM feature_quality_check
+    GROUP BY project_id
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_project_overview_mv_project_id ON project_overview_mv (project_id)",
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS llm_drift_mv AS
+    SELECT project_id,
+           count(*) AS total_drift_checks,
+           count(*) FILTER (WHERE has_drift) AS drift_detected
+    FROM llm_drift
+    GROUP BY project_id
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_llm_drift_mv_project_id ON llm_drift_mv (project_id)",
+]
+
+
+async def create_materialized_views():
+    """Create the statistics views if they don't exist yet (populated on creation)."""
+    async with engine.begin() as conn:
+        for statement in _CREATE_VIEWS:
+            await conn.execute(text(statement))
+
+
+async def refresh_materialized_views():
+    """Recompute the statistics views without blocking readers."""
+    async with engine.begin() as conn:
+        for view in (project_overview_mv, llm_drift_mv):
+            await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}"))
+
+
+async def refresh_materialized_views_periodically(interval_seconds: int):
+    """Background loop refreshing the statistics views every `interval_seconds`."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await refresh_materialized_views()
+        except Exception as e:
+            print(f"⚠ Failed to refresh statistics views: {str(e)}")
@@ -9,7 +9,8 @@ from sqlalchemy import (
     Float,
     JSON,
     Index,
-    Boolean
+    Boolean,
+    LargeBinary
 )
 from sqlalchemy.orm import relationship
 import uuid
@@ -137,6 +138,12 @@ class Project(Base):
         back_populates="project",
         cascade="all, delete-orphan"
     )
+    baseline_prediction_stats = relationship(
+        "BaselinePredictionStats",
+        back_populates="project",
+        uselist=False,
+        cascade="all, delete-orphan"
+    )
 
     # LLM MONITORING Relationships
     llm_config = relationship(
@@ -210,6 +217,7 @@ class FeatureInput(Base):
     __table_args__ = (
         Index("idx_feature_input_project_id", "project_id"),
         Index("idx_feature_input_project_stage", "project_id", "stage"),
+        Index("idx_feature_input_project_row_id", "project_id", "row_id"),
     )
 
 class FeatureConfig(Base):
@@ -246,6 +254,7 @@ class FeatureDriftConfig(Base):
     min_samples = Column(Integer, nullable=False, default=50)
     alert_threshold = Column(Integer, nullable=False, default=2)
     model_based_drift_threshold = Column(Float, nullable=False, default=0.50)
+    model_based_drift_max_samples = Column(Integer, nullable=False, default=50000, server_default="50000")
     created_at = Column(TIMESTAMP, server_default=func.now())
 
 class FeatureDrift(Base):
@@ -353,6 +362,8 @@ class FeatureQualityCheck(Base):
 
     __table_args__ = (
         Index("idx_feature_quality_project_batch", "project_id", "batch_number"),
+        Index("idx_feature_quality_project_timestamp", "project_id", "check_timestamp"),
+        Index("idx_feature_quality_project_status", "project_id", "check_status"),
     )
 
 class FeatureValidationParams(Base):
@@ -368,7 +379,11 @@ class FeatureValidationParams(Base):
 
 class FeatureValidation(Base):
     __tablename__ = "feature_validation"
-    __table_args__ = {"keep_existing": True}
+    __table_args__ = (
+        Index("idx_feature_validation_project_created", "project_id", "created_at"),
+        Index("idx_feature_validation_project_status", "project_id", "validation_status"),
+        {"keep_existing": True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), index=True)
@@ -437,6 +452,7 @@ class PredictionOutput(Base):
 
     __table_args__ = (
         Index("idx_prediction_output_project_id", "project_id"),
+        Index("idx_prediction_output_project_row_id", "project_id", "row_id"),
     )
 
 class PredictionConfig(Base):
@@ -522,6 +538,30 @@ class PredictionDrift(Base):
         Index("idx_prediction_drift_project_batch", "project_id", "batch_number"),
     )
 
+class BaselinePredictionStats(Base):
+    __tablename__ = "baseline_prediction_stats"
+
+    project_id = Column(
+        Integer,
+        ForeignKey("projects.project_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    # Baseline window the stats were computed from; a moved window invalidates them
+    baseline_start_row = Column(Integer, nullable=False)
+    baseline_end_row = Column(Integer, nullable=False)
+    n = Column(Integer, nullable=False)
+    mean = Column(Float, nullable=False)
+    median = Column(Float, nullable=False)
+    var = Column(Float, nullable=False)
+    quantiles = Column(JSON, nullable=False)
+    psi_bins = Column(Integer, nullable=False)
+    psi_breakpoints = Column(JSON, nullable=False)
+    psi_base_proportions = Column(JSON, nullable=False)
+    sorted_sample = Column(LargeBinary, nullable=False)  # float64 bytes
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+    project = relationship("Project", back_populates="baseline_prediction_stats")
+
 # =============================================================================
 # LLM MONITORING SDK
 # =============================================================================
@@ -635,6 +675,7 @@ class LLMDrift(Base):
     __table_args__ = (
         Index("idx_llm_drift_project_id", "project_id"),
         Index("idx_llm_drift_project_created", "project_id", "created_at"),
+        Index("idx_llm_drift_project_has_drift", "project_id", "has_drift"),
     )
 
 class PredictionEvaluationConfig(Base):
@@ -5,7 +5,7 @@ import warnings
 
 from app.database.connection import get_db
 from app.database import models, schemas
-from app.utils.auth import hash_password, verify_password, generate_session_token, get_current_user
+from app.utils.auth import hash_password, verify_password, generate_session_token, get_current_user, invalidate_auth_cache
 
 warnings.filterwarnings("ignore")
 
@@ -42,7 +42,7 @@ async def register(
         )
     
     # Hash password before storing
-    hashed_password = hash_password(user.password)
+    hashed_password = await hash_password(user.password)
     
     # Create new user
     new_user = models.Company(
@@ -90,13 +90,14 @@ async def login(
         )
     
     # Verify password
-    if not verify_password(user.password, user_record.password):
+    if not await verify_password(user.password, user_record.password):
         raise HTTPException(
             status_code=401,
             detail="Incorrect username or password"
         )
     
-    # Generate and store session token
+    # Generate and store session token (the previous one stops being valid)
+    invalidate_auth_cache(session_token=user_record.session_token)
     token = generate_session_token()
     user_record.session_token = token
     
@@ -135,6 +136,7 @@ async def logout(
     Returns:
         Success message
     """
+    invalidate_auth_cache(session_token=current_user.session_token)
     current_user.session_token = None
     await db.commit()
     
@@ -252,5 +252,6 @@ async def get_drift_config(
         "psi_bins": config.psi_bins,
         "min_samples": config.min_samples,
         "alert_threshold": config.alert_threshold,
-        "model_based_drift_threshold": config.model_based_drift_threshold
+        "model_based_drift_threshold": config.model_based_drift_threshold,
+        "model_based_drift_max_samples": config.model_based_drift_max_samples
     }
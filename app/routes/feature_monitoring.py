@@ -100,7 +100,8 @@ async def get_drift_config(
             "psi_bins": 10,
             "min_samples": 50,
             "alert_threshold": 2,
-            "model_based_drift_threshold": 0.50
+            "model_based_drift_threshold": 0.50,
+            "model_based_drift_max_samples": 50000
         }
     
     return config
@@ -128,7 +129,8 @@ async def update_drift_config(
     fields = [
         "mean_threshold", "median_threshold", "variance_threshold",
         "ks_pvalue_threshold", "psi_threshold", "psi_bins",
-        "min_samples", "alert_threshold", "model_based_drift_threshold"
+        "min_samples", "alert_threshold", "model_based_drift_threshold",
+        "model_based_drift_max_samples"
     ]
     
     for field in fields:
@@ -4,7 +4,7 @@ import warnings
 import secrets
 from app.database.connection import get_db
 from app.database import models, schemas
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, invalidate_auth_cache
 
 
 warnings.filterwarnings("ignore")
@@ -23,6 +23,12 @@ async def generate_api_key(
     # Generate a new random API key
     new_api_key = secrets.token_hex(32)
     
+    # Revoke cached lookups for the old key and the session snapshot holding it
+    invalidate_auth_cache(
+        session_token=current_user.session_token,
+        api_key=current_user.api_key
+    )
+    
     # Update the current user (Company) with the new API key
     current_user.api_key = new_api_key
     
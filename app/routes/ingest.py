@@ -3,6 +3,8 @@ from fastapi import APIRouter, HTTPException, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import datetime
+import orjson
+import pyarrow as pa
 
 from app.database.connection import get_db
 from app.database import models
@@ -10,6 +12,16 @@ from app.services.feature_monitoring.ingestion_service import IngestionService
 
 router = APIRouter(tags=["Ingest"])
 
+
+def _columns_to_records(columns: dict) -> list:
+    """Expand a column-oriented payload {column: [values...]} into row dicts."""
+    names = list(columns)
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise HTTPException(status_code=400, detail="All columns must have the same length")
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
 async def get_current_project_by_key(
     request: Request,
     db: AsyncSession = Depends(get_db)
@@ -51,16 +63,49 @@ async def ingest_data(
     auth: dict = Depends(get_current_project_by_key)
 ):
     payload = await request.json()
+    features = payload.get("features")
+
+    # SDK sends DataFrames column-oriented
+    if not features and payload.get("columns"):
+        features = _columns_to_records(payload["columns"])
+
+    if not features:
+        raise HTTPException(status_code=400, detail="features are required")
+
+    return await _ingest_features(db, auth, payload, features)
+
+
+@router.post("/arrow")
+async def ingest_arrow(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    auth: dict = Depends(get_current_project_by_key)
+):
+    """
+    Ingest a DataFrame sent as an Arrow IPC stream.
+    project_name, event_time, stage and metadata travel as JSON in the
+    schema metadata under the "watchtower" key.
+    """
+    try:
+        table = pa.ipc.open_stream(await request.body()).read_all()
+        payload = orjson.loads((table.schema.metadata or {}).get(b"watchtower", b"{}"))
+    except (pa.ArrowInvalid, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid Arrow IPC stream")
+
+    features = table.to_pylist()
+    if not features:
+        raise HTTPException(status_code=400, detail="features are required")
 
+    return await _ingest_features(db, auth, payload, features)
+
+
+async def _ingest_features(db: AsyncSession, auth: dict, payload: dict, features: list):
+    """Resolve the project, validate the stage and store the feature rows."""
     project_name = payload.get("project_name")
-    features = payload.get("features")
     event_time_str = payload.get("event_time")
     stage = payload.get("stage", "model_input")  # Extract stage from payload
     metadata = payload.get("metadata", {})
 
-    if not features:
-        raise HTTPException(status_code=400, detail="features are required")
-
     project = auth["project"]
     if not project:
         if not project_name:
@@ -18,6 +18,42 @@ router = APIRouter(
 )
 
 
+async def _get_project_record(
+    db: AsyncSession,
+    project_id: int,
+    company_id: int,
+    model,
+    record_id: int,
+    not_found_detail: str
+):
+    """
+    Fetch one record of a company's project in a single query.
+    
+    The ownership check and the record lookup share one round trip: the record
+    is outer-joined to the project row, so a missing project and a missing
+    record still produce their own 404s.
+    """
+    result = await db.execute(
+        select(models.Project.project_id, model)
+        .outerjoin(
+            model,
+            and_(model.id == record_id, model.project_id == models.Project.project_id)
+        )
+        .where(
+            models.Project.project_id == project_id,
+            models.Project.company_id == company_id
+        )
+    )
+    row = result.one_or_none()
+    
+    if row is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if row[1] is None:
+        raise HTTPException(status_code=404, detail=not_found_detail)
+    
+    return row[1]
+
+
 @router.get('/{project_id}/overview')
 async def get_project_overview(
     project_id: int,
@@ -142,31 +178,10 @@ async def get_drift_run_detail(
     current_user: models.Company = Depends(get_current_user)
 ):
     """Get detailed information for a specific drift run."""
-    # Verify project belongs to user
-    result = await db.execute(
-        select(models.Project).where(
-            models.Project.project_id == project_id,
-            models.Project.company_id == current_user.company_id
-        )
-    )
-    project = result.scalar_one_or_none()
-    
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Get specific drift run
-    drift_result = await db.execute(
-        select(models.FeatureDrift).where(
-            and_(
-                models.FeatureDrift.id == drift_id,
-                models.FeatureDrift.project_id == project_id
-            )
-        )
+    drift = await _get_project_record(
+        db, project_id, current_user.company_id,
+        models.FeatureDrift, drift_id, "Drift run not found"
     )
-    drift = drift_result.scalar_one_or_none()
-    
-    if not drift:
-        raise HTTPException(status_code=404, detail="Drift run not found")
     
     # Get corresponding model-based drift (closest in time)
     # Since they run together, timestamps should be very close
@@ -270,31 +285,10 @@ async def get_quality_run_detail(
     current_user: models.Company = Depends(get_current_user)
 ):
     """Get detailed information for a specific quality check run."""
-    # Verify project belongs to user
-    result = await db.execute(
-        select(models.Project).where(
-            models.Project.project_id == project_id,
-            models.Project.company_id == current_user.company_id
-        )
-    )
-    project = result.scalar_one_or_none()
-    
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Get specific quality check
-    check_result = await db.execute(
-        select(models.FeatureQualityCheck).where(
-            and_(
-                models.FeatureQualityCheck.id == check_id,
-                models.FeatureQualityCheck.project_id == project_id
-            )
-        )
+    check = await _get_project_record(
+        db, project_id, current_user.company_id,
+        models.FeatureQualityCheck, check_id, "Quality check not found"
     )
-    check = check_result.scalar_one_or_none()
-    
-    if not check:
-        raise HTTPException(status_code=404, detail="Quality check not found")
     
     return {
         "check_id": check.id,
@@ -365,31 +359,10 @@ async def get_llm_query_detail(
     current_user: models.Company = Depends(get_current_user)
 ):
     """Get detailed information for a specific LLM query."""
-    # Verify project belongs to user
-    result = await db.execute(
-        select(models.Project).where(
-            models.Project.project_id == project_id,
-            models.Project.company_id == current_user.company_id
-        )
-    )
-    project = result.scalar_one_or_none()
-    
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Get specific LLM query
-    llm_result = await db.execute(
-        select(models.LLMMonitor).where(
-            and_(
-                models.LLMMonitor.id == query_id,
-                models.LLMMonitor.project_id == project_id
-            )
-        )
+    llm = await _get_project_record(
+        db, project_id, current_user.company_id,
+        models.LLMMonitor, query_id, "LLM query not found"
     )
-    llm = llm_result.scalar_one_or_none()
-    
-    if not llm:
-        raise HTTPException(status_code=404, detail="LLM query not found")
     
     return {
         "query_id": llm.id,
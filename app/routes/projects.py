@@ -288,7 +288,8 @@ async def get_drift_config(
             "psi_bins": 10,
             "min_samples": 50,
             "alert_threshold": 2,
-            "model_based_drift_threshold": 0.50
+            "model_based_drift_threshold": 0.50,
+            "model_based_drift_max_samples": 50000
         }
     
     return {
@@ -302,7 +303,8 @@ async def get_drift_config(
         "psi_bins": config.psi_bins,
         "min_samples": config.min_samples,
         "alert_threshold": config.alert_threshold,
-        "model_based_drift_threshold": config.model_based_drift_threshold
+        "model_based_drift_threshold": config.model_based_drift_threshold,
+        "model_based_drift_max_samples": config.model_based_drift_max_samples
     }
 
 
@@ -358,6 +360,8 @@ async def update_drift_config(
         config.alert_threshold = int(config_data["alert_threshold"])
     if "model_based_drift_threshold" in config_data:
         config.model_based_drift_threshold = float(config_data["model_based_drift_threshold"])
+    if "model_based_drift_max_samples" in config_data:
+        config.model_based_drift_max_samples = int(config_data["model_based_drift_max_samples"])
     
     await db.commit()
     await db.refresh(config)
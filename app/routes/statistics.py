@@ -2,19 +2,23 @@
 Statistics API endpoints for project metrics and visualizations.
 Provides data for charts, graphs, and dashboard displays.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, List
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from cachetools import TTLCache
+import hashlib
 
 from app.database.connection import get_db
 from app.database import models
 from app.utils.auth import get_current_user
+from app.constants import STATS_CACHE_TTL_SECONDS, STATS_CACHE_MAX_SIZE
 from app.utils.statistics_aggregator import (
-    get_project_overview_stats,
     get_test_history,
     get_time_series_stats,
-    get_validation_stats,
-    get_drift_detection_stats
+    get_dashboard_stats,
+    get_quality_checks_version
 )
 
 router = APIRouter(
@@ -22,6 +26,41 @@ router = APIRouter(
     tags=["Statistics"]
 )
 
+# project_id -> (overview, validation, drift). Keyed by project only because
+# ownership is verified on every request before the cache is read.
+_overview_cache: TTLCache = TTLCache(maxsize=STATS_CACHE_MAX_SIZE, ttl=STATS_CACHE_TTL_SECONDS)
+
+
+async def _quality_checks_validators(
+    db: AsyncSession,
+    project_id: int,
+    *extra
+) -> Dict[str, str]:
+    """
+    Build ETag / Last-Modified headers for responses derived from quality checks.
+    
+    Args:
+        extra: Additional values the response depends on besides the checks
+            (endpoint name and query parameters, so each page gets its own ETag)
+    """
+    latest, count = await get_quality_checks_version(db, project_id)
+    key = ":".join(str(part) for part in (latest, count, *extra))
+    headers = {"ETag": f'"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'}
+    if latest is not None:
+        if latest.tzinfo is None:
+            latest = latest.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(latest.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def _not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """Whether the client's If-None-Match already names the current ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or headers["ETag"] in tags
+
 
 @router.get("/{project_id}/overview")
 async def get_project_statistics(
@@ -49,10 +88,12 @@ async def get_project_statistics(
             detail="Project not found or you don't have access to it"
         )
     
-    # Gather all statistics
-    overview = await get_project_overview_stats(db, project_id)
-    validation = await get_validation_stats(db, project_id)
-    drift = await get_drift_detection_stats(db, project_id)
+    # Gather all statistics (short-lived cache; dashboards poll this endpoint)
+    cached = _overview_cache.get(project_id)
+    if cached is None:
+        # One statement (CTEs) returns all three on the request's own session
+        cached = _overview_cache[project_id] = await get_dashboard_stats(db, project_id)
+    overview, validation, drift = cached
     
     return {
         "project_id": project_id,
@@ -66,13 +107,18 @@ async def get_project_statistics(
 @router.get("/{project_id}/tests")
 async def get_project_tests(
     project_id: int,
+    request: Request,
+    response: Response,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[datetime] = None,
+    cursor_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
     current_user: models.Company = Depends(get_current_user)
 ):
     """
     Get test history for a project with pagination.
+    Pass `next_cursor` from the previous page as `cursor`/`cursor_id` for keyset paging.
     """
     # Verify project ownership
     from sqlalchemy import select
@@ -90,19 +136,34 @@ async def get_project_tests(
             detail="Project not found or you don't have access to it"
         )
     
-    tests = await get_test_history(db, project_id, limit, offset)
+    # Polling clients get a bodiless 304 while no checks were added or removed
+    validators = await _quality_checks_validators(
+        db, project_id, "tests", limit, offset, cursor, cursor_id
+    )
+    if _not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+    response.headers.update(validators)
+    
+    tests = await get_test_history(db, project_id, limit, offset, cursor, cursor_id)
+    
+    next_cursor = None
+    if len(tests) == limit:
+        next_cursor = {"cursor": tests[-1]["check_timestamp"], "cursor_id": tests[-1]["id"]}
     
     return {
         "project_id": project_id,
         "tests": tests,
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/{project_id}/timeseries")
 async def get_project_timeseries(
     project_id: int,
+    request: Request,
+    response: Response,
     days: int = 30,
     db: AsyncSession = Depends(get_db),
     current_user: models.Company = Depends(get_current_user)
@@ -127,6 +188,14 @@ async def get_project_timeseries(
             detail="Project not found or you don't have access to it"
         )
     
+    # The window start moves daily, so today's date is part of the ETag too
+    validators = await _quality_checks_validators(
+        db, project_id, "timeseries", days, datetime.now(timezone.utc).date()
+    )
+    if _not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+    response.headers.update(validators)
+    
     timeseries = await get_time_series_stats(db, project_id, days)
     
     return {
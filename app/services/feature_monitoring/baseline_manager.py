@@ -286,7 +286,7 @@ class BaselineManager:
                         baseline_info.baseline_start_row_feature_input,
                         baseline_info.baseline_end_row_feature_input
                     )
-                )
+                ).order_by(models.FeatureInput.row_id)
             )
             feature_rows = feature_result.scalars().all()
             
@@ -298,7 +298,7 @@ class BaselineManager:
                         baseline_info.baseline_start_row_prediction_output,
                         baseline_info.baseline_end_row_prediction_output
                     )
-                )
+                ).order_by(models.PredictionOutput.row_id)
             )
             prediction_rows = prediction_result.scalars().all()
             
@@ -349,7 +349,7 @@ class BaselineManager:
                         monitor_info.monitor_start_row_feature_input,
                         monitor_info.monitor_end_row_feature_input
                     )
-                )
+                ).order_by(models.FeatureInput.row_id)
             )
             feature_rows = feature_result.scalars().all()
             
@@ -14,6 +14,7 @@ from app.services.feature_monitoring.check_data_quality import FeatureQualityChe
 from app.services.feature_monitoring.data_drift import InputDataDriftMonitor
 from app.services.feature_monitoring.model_based_data_drift import ModelBasedDriftMonitor
 from app.database.connection import AsyncSessionLocal
+from app.constants import DRIFT_BASELINE_SAMPLE_SIZE
 
 class IngestionService:
     def __init__(self, db: AsyncSession):
@@ -341,15 +342,37 @@ class IngestionService:
             baseline_preds = baseline_data['prediction_data']
             
             if len(baseline_preds) > 0 and len(predictions) > 0:
-                from app.services.prediction_monitoring.prediction_drift import PredictionOutputMonitor
-                
+                from app.services.prediction_monitoring.prediction_drift import (
+                    PredictionOutputMonitor,
+                    load_baseline_prediction_stats,
+                    store_baseline_prediction_stats
+                )
+
+                task_type = model_type or "regression"
+                baseline_range = baseline_data['prediction_range']
+
+                # Baseline is static between baseline moves, so regression reuses stored stats
+                baseline_stats = None
+                if task_type == "regression":
+                    baseline_stats = await load_baseline_prediction_stats(project_id, baseline_range, self.db)
+
                 # Run Drift Detection
                 monitor = PredictionOutputMonitor(
+                    project_id=project_id,
                     baseline_predictions=np.array(baseline_preds),
                     current_predictions=np.array(predictions),
-                    task_type=model_type or "regression"
+                    task_type=task_type,
+                    baseline_stats=baseline_stats
                 )
-                drift_results = monitor.run()
+
+                if task_type == "regression" and baseline_stats is None:
+                    baseline_stats = monitor.compute_baseline_stats(sample_size=DRIFT_BASELINE_SAMPLE_SIZE)
+                    if baseline_stats is not None:
+                        await store_baseline_prediction_stats(project_id, baseline_range, baseline_stats, db=self.db)
+                        monitor.baseline_stats = baseline_stats
+
+                # Results are stored below with this batch's transaction
+                drift_results = monitor.monitor()
 
                 # Store Drift Results
                 pred_drift = models.PredictionDrift(
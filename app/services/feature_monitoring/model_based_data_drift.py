@@ -8,6 +8,7 @@ from app.database import models
 from app.database.connection import AsyncSessionLocal
 from app.constants import (
     MODEL_BASED_DRIFT_THRESHOLD,
+    MODEL_BASED_DRIFT_MAX_SAMPLES,
     MODEL_RF_N_ESTIMATORS,
     MODEL_RF_RANDOM_STATE,
     MODEL_RF_TEST_SIZE
@@ -31,6 +32,7 @@ class ModelBasedDriftMonitor:
         alert_threshold: float = None,
         test_size: float = 0.2,
         random_state: int = 42,
+        max_samples: int = None,
     ):
         """
         Initialize the model-based drift monitor.
@@ -42,6 +44,7 @@ class ModelBasedDriftMonitor:
             alert_threshold: Accuracy threshold for alert (loaded from config if None)
             test_size: Proportion of data for testing
             random_state: Random seed for reproducibility
+            max_samples: Max rows per class used for training (loaded from config if None)
         """
         self.project_id = project_id
         self.baseline_data = baseline_data.copy()
@@ -54,6 +57,7 @@ class ModelBasedDriftMonitor:
         self.alert_threshold = alert_threshold
         self.test_size = test_size
         self.random_state = random_state
+        self.max_samples = max_samples
 
         self.model = RandomForestClassifier(
             n_estimators=MODEL_RF_N_ESTIMATORS,
@@ -64,8 +68,8 @@ class ModelBasedDriftMonitor:
         self.results = None
 
     async def load_config(self):
-        """Load alert threshold from FeatureDriftConfig."""
-        if self.alert_threshold is not None:
+        """Load alert threshold and sample cap from FeatureDriftConfig."""
+        if self.alert_threshold is not None and self.max_samples is not None:
             return  # Already set
         
         async with AsyncSessionLocal() as db:
@@ -78,10 +82,27 @@ class ModelBasedDriftMonitor:
             
             if config:
                 # Load model-based drift threshold from config
-                self.alert_threshold = config.model_based_drift_threshold
-            else:
-                # Default from constants if no config found
+                if self.alert_threshold is None:
+                    self.alert_threshold = config.model_based_drift_threshold
+                if self.max_samples is None:
+                    self.max_samples = config.model_based_drift_max_samples
+            
+            # Default from constants if no config found (or column not yet populated)
+            if self.alert_threshold is None:
                 self.alert_threshold = MODEL_BASED_DRIFT_THRESHOLD
+            if self.max_samples is None:
+                self.max_samples = MODEL_BASED_DRIFT_MAX_SAMPLES
+
+    def _subsample(self, df: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+        """
+        Randomly downsample a frame to at most `max_samples` rows.
+        Classifier accuracy saturates well before very large N, so this bounds fit time.
+        """
+        cap = self.max_samples or MODEL_BASED_DRIFT_MAX_SAMPLES
+        if len(df) <= cap:
+            return df
+        idx = rng.choice(len(df), cap, replace=False)
+        return df.iloc[np.sort(idx)]
 
     def _build_training_data(self):
         """
@@ -91,8 +112,10 @@ class ModelBasedDriftMonitor:
         # Select only numeric columns to avoid issues with dates/strings
         numeric_cols = self.baseline_data.select_dtypes(include=[np.number]).columns
         
-        baseline_numeric = self.baseline_data[numeric_cols].copy()
-        current_numeric = self.current_data[numeric_cols].copy()
+        # Cap rows per class (seeded for reproducibility) before building the training set
+        rng = np.random.default_rng(self.random_state)
+        baseline_numeric = self._subsample(self.baseline_data[numeric_cols], rng).copy()
+        current_numeric = self._subsample(self.current_data[numeric_cols], rng).copy()
         
         # Add source labels
         baseline_numeric["__source__"] = 0
@@ -3,7 +3,10 @@ LLM Model Initialization - Preload expensive models at startup
 This module ensures models are loaded once and cached globally.
 """
 import os
+import asyncio
 import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 # Model cache
@@ -15,6 +18,9 @@ _models_cache = {
 
 _init_lock = threading.Lock()
 
+# Worker process holding the models for CPU-bound inference (see start_inference_pool)
+_inference_pool: Optional[ProcessPoolExecutor] = None
+
 
 def initialize_llm_models(background: bool = True) -> None:
     """
@@ -80,3 +86,46 @@ def get_cached_detoxify():
         from detoxify import Detoxify
         _models_cache["detoxify"] = Detoxify("original")
     return _models_cache["detoxify"]
+
+
+def start_inference_pool() -> ProcessPoolExecutor:
+    """
+    Start a single worker process that preloads the models and serves inference.
+    Keeps model inference off the event loop's process, so CPU-bound scoring
+    never holds the GIL the API workers need. Call once per server process.
+    """
+    global _inference_pool
+    if _inference_pool is None:
+        # spawn: the worker must not inherit the event loop or open DB connections
+        _inference_pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initialize_llm_models,
+            initargs=(False,)
+        )
+        # Workers start on first submit; start it now so models load at startup
+        _inference_pool.submit(os.getpid)
+    return _inference_pool
+
+
+def shutdown_inference_pool() -> None:
+    """Stop the inference worker process."""
+    global _inference_pool
+    if _inference_pool is not None:
+        _inference_pool.shutdown(wait=False, cancel_futures=True)
+        _inference_pool = None
+
+
+def predict_toxicity(text: str) -> dict:
+    """Detoxify scores for `text` as plain floats (runs inside the inference worker)."""
+    results = get_cached_detoxify().predict(text)
+    return {k: float(v) for k, v in results.items()}
+
+
+async def predict_toxicity_async(text: str) -> dict:
+    """
+    Score toxicity without blocking the event loop: in the inference worker
+    process when it is running, otherwise in the default thread pool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_inference_pool, predict_toxicity, text)
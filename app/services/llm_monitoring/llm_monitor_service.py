@@ -8,7 +8,7 @@ from app.database.connection import get_db
 from app.services.llm_monitoring.llm_token_service import LLMTokenizer
 from app.services.llm_monitoring.llm_baseline_manager import LLMBaselineManager
 from app.services.llm_monitoring.llm_drift_detector import LLMDriftDetector
-from app.services.llm_monitoring.llm_model_init import get_cached_detoxify
+from app.services.llm_monitoring.llm_model_init import predict_toxicity_async
 from langchain_groq import ChatGroq
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import PromptTemplate
@@ -21,11 +21,10 @@ class LLMMonitorService:
 
     def __init__(self):
         """
-        Initialize service with lazy-loaded tokenizer and detoxify models.
-        Models are loaded on first use to minimize initialization time.
+        Initialize service with the lazy-loaded tokenizer.
+        Toxicity scoring runs in the inference worker process (see llm_model_init).
         """
         self.tokenizer = LLMTokenizer(model_name="gpt2")
-        self._detoxify = None  # Lazy load on first use
 
     async def log_interaction(
         self,
@@ -55,7 +54,7 @@ class LLMMonitorService:
                 response_token_length = self.tokenizer.count_tokens(response_text)
 
                 # 3. Check toxicity
-                toxicity_result, is_toxic = self._check_toxicity(response_text)
+                toxicity_result, is_toxic = await self._check_toxicity(response_text)
 
                 # 4. Get LLM judge metrics
                 judge_metrics = await self._llm_as_judge(input_text, response_text)
@@ -100,9 +99,9 @@ class LLMMonitorService:
                 print(f"Error logging interaction: {str(e)}")
                 raise
 
-    def _check_toxicity(self, response_text: str) -> tuple:
+    async def _check_toxicity(self, response_text: str) -> tuple:
         """
-        Check toxicity of response using cached Detoxify model.
+        Check toxicity of response using the Detoxify model in the inference worker.
         
         Args:
             response_text: Response to check
@@ -111,11 +110,7 @@ class LLMMonitorService:
             tuple: (detoxify_results_dict, is_toxic_bool)
         """
         try:
-            # Get cached detoxify model (lazy loaded once)
-            if self._detoxify is None:
-                self._detoxify = get_cached_detoxify()
-            
-            results = self._detoxify.predict(response_text)
+            results = await predict_toxicity_async(response_text)
 
             # results = {
             #     'toxicity': 0.xxx,
@@ -126,9 +121,6 @@ class LLMMonitorService:
             #     'identity_attack': 0.xxx
             # }
 
-            # Convert numpy floats to native python floats
-            results = {k: float(v) for k, v in results.items()}
-            
             is_toxic = results.get('toxicity', 0) > 0.5
 
             return results, is_toxic
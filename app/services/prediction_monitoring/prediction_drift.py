@@ -1,13 +1,69 @@
 import numpy as np
 import pandas as pd
-from scipy.stats import ks_2samp
-from sqlalchemy import select
+from numba import njit
+from scipy.stats import ks_2samp, kstwo
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from app.database import models
 from app.database.connection import AsyncSessionLocal
+from app.constants import DRIFT_KS_EXACT_MAX_SAMPLES
 from app.services.feature_monitoring.drift_llm_interpreter import interpret_prediction_drift
 
+def _ks_2samp_asymp(base_sorted: np.ndarray, curr_sorted: np.ndarray, n_base: Optional[int] = None):
+    """
+    Two-sided two-sample KS test with Smirnov's asymptotic p-value on already
+    sorted inputs. Same result as ks_2samp(..., method="asymp") on NaN-free
+    input, without re-sorting or the per-call validation / nan-policy wrapper.
+    `n_base` is the baseline's full size when `base_sorted` is a subsample of
+    it; the p-value is computed for that size rather than the sample's.
+    """
+    n1, n2 = len(base_sorted), len(curr_sorted)
+    data_all = np.concatenate([base_sorted, curr_sorted])
+    cdf1 = np.searchsorted(base_sorted, data_all, side="right") / n1
+    cdf2 = np.searchsorted(curr_sorted, data_all, side="right") / n2
+    d = np.float64(np.max(np.abs(cdf1 - cdf2)))
+    if n_base is not None:
+        n1 = n_base
+    en = n1 * n2 / (n1 + n2)
+    p_val = np.clip(kstwo.sf(d, np.round(en)), 0, 1)
+    return d, p_val
+
+
+@njit(cache=True)
+def _bin_proportions(inner_breakpoints, values):
+    """
+    Share of values in each bin delimited by the interior baseline breakpoints.
+    Bucket index is the number of breakpoints <= value, matching np.histogram
+    with -inf/+inf outer edges.
+    """
+    n_bins = inner_breakpoints.shape[0] + 1
+    # Breakpoints are monotone, so bucket assignment is a searchsorted + bincount
+    counts = np.bincount(np.searchsorted(inner_breakpoints, values, side="right"), minlength=n_bins)
+    return counts / values.shape[0]
+
+
+@njit(cache=True)
+def _psi_from_proportions(base_props, curr_props):
+    psi = 0.0
+    for j in range(base_props.shape[0]):
+        # avoid division by zero
+        b = max(base_props[j], 1e-6)
+        c = max(curr_props[j], 1e-6)
+        psi += (b - c) * np.log(b / c)
+    return psi
+
+
+@njit(cache=True)
+def _psi_kernel(inner_breakpoints, base, current):
+    """PSI over bins delimited by the interior baseline breakpoints."""
+    return _psi_from_proportions(
+        _bin_proportions(inner_breakpoints, base),
+        _bin_proportions(inner_breakpoints, current),
+    )
+
+
 class PredictionOutputMonitor:
     def __init__(
         self,
@@ -27,12 +83,15 @@ class PredictionOutputMonitor:
         ks_threshold=0.1,
         psi_bins=10,
         psi_thresholds=(0.1, 0.25),
-        min_samples=50
+        min_samples=50,
+        baseline_stats: Optional[Dict[str, Any]] = None,
+        skip_dropna: bool = False
     ):
         """
         Args:
             project_id: Project ID for database storage
             baseline_predictions: np.ndarray or pd.DataFrame/Series of model predictions from baseline
+                (may be None for regression when `baseline_stats` is given)
             current_predictions: same as baseline, production predictions
             task_type: "regression" or "classification"
             batch_no: Optional batch number
@@ -44,6 +103,10 @@ class PredictionOutputMonitor:
             psi_bins: number of bins for PSI calculation
             psi_thresholds: (low, high) drift levels
             min_samples: skip monitoring if sample size too small
+            baseline_stats: precomputed baseline statistics (see compute_baseline_stats /
+                load_baseline_prediction_stats); regression reads the baseline side from
+                these instead of re-scanning baseline_predictions
+            skip_dropna: predictions are known to be non-null, skip the NaN scan
         """
         # Project and batch info
         self.project_id = project_id
@@ -70,6 +133,8 @@ class PredictionOutputMonitor:
         self.psi_bins = psi_bins
         self.psi_thresholds = psi_thresholds
         self.min_samples = min_samples
+        self.baseline_stats = baseline_stats
+        self.skip_dropna = skip_dropna
 
         self.results = {
             "mean_drift": None,
@@ -89,59 +154,157 @@ class PredictionOutputMonitor:
             return None
         return abs(curr - base) / abs(base)
 
+    def _non_null(self, predictions: pd.DataFrame) -> pd.Series:
+        """
+        Prediction column without nulls. NumPy integer and bool columns cannot
+        hold NaN, so the scan is skipped for them (pandas nullable dtypes can).
+        """
+        col = predictions["pred"]
+        if self.skip_dropna or (isinstance(col.dtype, np.dtype) and col.dtype.kind in "iub"):
+            return col
+        return col.dropna()
+
     @staticmethod
-    def _compute_psi(base, current, bins=10):
-        # create breakpoints from baseline
-        breakpoints = np.percentile(base, np.linspace(0, 100, bins + 1))
-        breakpoints[0] = -np.inf
-        breakpoints[-1] = np.inf
+    def _class_codes(labels: pd.Series):
+        """Integer class codes and their labels; categorical columns reuse their stored codes."""
+        if isinstance(labels.dtype, pd.CategoricalDtype):
+            return labels.cat.codes.to_numpy(), labels.cat.categories
+        return pd.factorize(labels, sort=False)
 
-        base_counts = np.histogram(base, bins=breakpoints)[0] / len(base)
-        curr_counts = np.histogram(current, bins=breakpoints)[0] / len(current)
+    @staticmethod
+    def _quantile_positions(n, qs):
+        """Fractional positions and bracketing indices for linear-interpolated quantiles."""
+        pos = np.asarray(qs, dtype=np.float64) * (n - 1)
+        lo = np.floor(pos).astype(np.intp)
+        hi = np.minimum(lo + 1, n - 1)
+        return pos, lo, hi
 
-        # avoid division by zero
-        base_counts = np.clip(base_counts, 1e-6, None)
-        curr_counts = np.clip(curr_counts, 1e-6, None)
+    @classmethod
+    def _sorted_quantiles(cls, sorted_arr, qs):
+        """Linear-interpolated quantiles (np.quantile semantics) read off a sorted array."""
+        pos, lo, hi = cls._quantile_positions(len(sorted_arr), qs)
+        return sorted_arr[lo] + (sorted_arr[hi] - sorted_arr[lo]) * (pos - lo)
+
+    @classmethod
+    def _partition_quantiles(cls, arr, qs):
+        """
+        Linear-interpolated quantiles (np.quantile semantics) from a single
+        np.partition over every required order statistic, avoiding a full sort.
+        """
+        arr = np.asarray(arr, dtype=np.float64)
+        pos, lo, hi = cls._quantile_positions(len(arr), qs)
+        part = np.partition(arr, np.unique(np.concatenate([lo, hi])))
+        return part[lo] + (part[hi] - part[lo]) * (pos - lo)
+
+    @classmethod
+    def _compute_psi(cls, base, current, bins=10, breakpoints=None):
+        # create breakpoints from baseline (callers may pass precomputed ones)
+        if breakpoints is None:
+            breakpoints = cls._partition_quantiles(base, np.linspace(0, 1, bins + 1))
+        inner = np.ascontiguousarray(breakpoints[1:-1], dtype=np.float64)
+
+        return _psi_kernel(
+            inner,
+            np.ascontiguousarray(base, dtype=np.float64),
+            np.ascontiguousarray(current, dtype=np.float64),
+        )
+
+    # ---------------- Baseline Statistics ----------------
+    def compute_baseline_stats(self, sample_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Baseline-side regression statistics, in the shape stored in BaselinePredictionStats.
+
+        Args:
+            sample_size: keep at most this many evenly spaced points of the sorted
+                baseline for the KS test (None keeps all of them)
+
+        Returns:
+            Dict of statistics, or None if there are no baseline predictions
+        """
+        if self.baseline is None:
+            return None
+        base = self._non_null(self.baseline)
+        if len(base) == 0:
+            return None
 
-        psi = np.sum((base_counts - curr_counts) * np.log(base_counts / curr_counts))
-        return psi
+        base_arr = np.sort(base.to_numpy(dtype=np.float64, copy=False))
+        q_list = np.array([0.5, *self.quantiles])
+        psi_edges = np.linspace(0, 1, self.psi_bins + 1)
+        base_q = self._sorted_quantiles(base_arr, np.concatenate([q_list, psi_edges]))
+        breakpoints = base_q[len(q_list):]
+
+        sample = base_arr
+        if sample_size is not None and len(base_arr) > sample_size:
+            # Evenly spaced order statistics keep the sample's empirical CDF close to the full one
+            sample = base_arr[np.linspace(0, len(base_arr) - 1, sample_size).round().astype(np.intp)]
+
+        return {
+            "n": len(base_arr),
+            "mean": float(base_arr.mean()),
+            "median": float(base_q[0]),
+            "var": float(base_arr.var()),
+            "quantiles": {str(q): float(v) for q, v in zip(self.quantiles, base_q[1:len(q_list)])},
+            "psi_bins": self.psi_bins,
+            "psi_breakpoints": breakpoints.tolist(),
+            "psi_base_proportions": _bin_proportions(
+                np.ascontiguousarray(breakpoints[1:-1]), base_arr
+            ).tolist(),
+            "sorted_sample": sample,
+        }
+
+    def _get_baseline_stats(self) -> Optional[Dict[str, Any]]:
+        """Provided baseline stats if they match this monitor's settings, else computed ones."""
+        stats = self.baseline_stats
+        if (
+            stats is not None
+            and stats["psi_bins"] == self.psi_bins
+            and all(str(q) in stats["quantiles"] for q in self.quantiles)
+        ):
+            return stats
+        return self.compute_baseline_stats()
 
     # ---------------- Regression Metrics ----------------
     def monitor_regression(self):
-        base = self.baseline["pred"].dropna()
-        curr = self.current["pred"].dropna()
+        base_stats = self._get_baseline_stats()
+        curr = self._non_null(self.current)
 
-        if len(base) < self.min_samples or len(curr) < self.min_samples:
+        if base_stats is None or base_stats["n"] < self.min_samples or len(curr) < self.min_samples:
             return
 
         results = {}
 
+        # Baseline side comes precomputed; sort the current side once and read
+        # median, quantiles and the KS statistic off the sorted array
+        base_arr = np.asarray(base_stats["sorted_sample"], dtype=np.float64)
+        curr_arr = np.sort(curr.to_numpy(dtype=np.float64, copy=False))
+        curr_q = self._sorted_quantiles(curr_arr, np.array([0.5, *self.quantiles]))
+
         # Mean
-        mean_base = base.mean()
-        mean_curr = curr.mean()
+        mean_base = base_stats["mean"]
+        mean_curr = curr_arr.mean()
         rc_mean = self._relative_change(mean_curr, mean_base)
         if rc_mean is not None and rc_mean > self.mean_threshold:
             results["mean_drift"] = rc_mean
 
         # Median
-        median_base = base.median()
-        median_curr = curr.median()
+        median_base = base_stats["median"]
+        median_curr = curr_q[0]
         rc_median = self._relative_change(median_curr, median_base)
         if rc_median is not None and rc_median > self.median_threshold:
             results["median_drift"] = rc_median
 
         # Variance
-        var_base = base.var(ddof=0)
-        var_curr = curr.var(ddof=0)
+        var_base = base_stats["var"]
+        var_curr = curr_arr.var()
         rc_var = self._relative_change(var_curr, var_base)
         if rc_var is not None and rc_var > self.variance_threshold:
             results["variance_drift"] = rc_var
 
         # Quantiles
         quantile_changes = {}
-        for q in self.quantiles:
-            q_base = base.quantile(q)
-            q_curr = curr.quantile(q)
+        for i, q in enumerate(self.quantiles, start=1):
+            q_base = base_stats["quantiles"][str(q)]
+            q_curr = curr_q[i]
             rc_q = self._relative_change(q_curr, q_base)
             if rc_q is not None and rc_q > self.variance_threshold:  # same as variance threshold
                 quantile_changes[q] = rc_q
@@ -149,11 +312,22 @@ class PredictionOutputMonitor:
             results["quantile_drift"] = quantile_changes
 
         # KS test
-        ks_stat, p_val = ks_2samp(base, curr)
+        # The exact p-value path is combinatorial; asymptotic is accurate for large N.
+        # The baseline side may be an evenly spaced subsample of the sorted baseline,
+        # so the p-value uses the full baseline size stored with the stats.
+        n_base = base_stats["n"]
+        if max(n_base, len(curr_arr)) > DRIFT_KS_EXACT_MAX_SAMPLES:
+            ks_stat, p_val = _ks_2samp_asymp(base_arr, curr_arr, n_base)
+        else:
+            ks_stat, p_val = ks_2samp(base_arr, curr_arr, method="auto")
         results["ks_test"] = {"ks_stat": ks_stat, "p_value": p_val, "drift": ks_stat > self.ks_threshold}
 
-        # PSI
-        psi_val = self._compute_psi(base, curr, bins=self.psi_bins)
+        # PSI against the stored baseline bin shares
+        inner = np.ascontiguousarray(base_stats["psi_breakpoints"][1:-1], dtype=np.float64)
+        psi_val = _psi_from_proportions(
+            np.asarray(base_stats["psi_base_proportions"], dtype=np.float64),
+            _bin_proportions(inner, curr_arr),
+        )
         if psi_val < self.psi_thresholds[0]:
             severity = "low"
         elif psi_val < self.psi_thresholds[1]:
@@ -177,26 +351,27 @@ class PredictionOutputMonitor:
 
     # ---------------- Classification Metrics ----------------
     def monitor_classification(self):
-        base = self.baseline["pred"].dropna()
-        curr = self.current["pred"].dropna()
+        base = self._non_null(self.baseline)
+        curr = self._non_null(self.current)
 
         if len(base) < self.min_samples or len(curr) < self.min_samples:
             return
 
         results = {}
 
-        # Class distribution
-        base_counts = base.value_counts(normalize=True)
-        curr_counts = curr.value_counts(normalize=True)
-
-        # Drift per class
-        class_drift = {}
-        for cls in base_counts.index:
-            b = base_counts.get(cls, 0)
-            c = curr_counts.get(cls, 0)
-            rc = self._relative_change(c, b)
-            if rc is not None and rc > self.mean_threshold:  # same threshold for class ratio
-                class_drift[cls] = rc
+        # Class distribution: factorize once, count codes, and keep the codes so the
+        # per-row class probabilities below are plain ndarray indexing
+        base_codes, base_classes = self._class_codes(base)
+        curr_codes, curr_classes = self._class_codes(curr)
+        base_probs = np.bincount(base_codes, minlength=len(base_classes)) / len(base_codes)
+        curr_probs = np.bincount(curr_codes, minlength=len(curr_classes)) / len(curr_codes)
+        base_counts = pd.Series(base_probs, index=base_classes)
+        curr_counts = pd.Series(curr_probs, index=curr_classes)
+
+        # Drift per class (aligned on baseline classes; zero-ratio baselines are skipped)
+        curr_aligned = curr_counts.reindex(base_counts.index, fill_value=0.0)
+        rc = (curr_aligned - base_counts).abs() / base_counts.replace(0, np.nan).abs()
+        class_drift = rc[rc > self.mean_threshold].to_dict()  # same threshold for class ratio
         if class_drift:
             results["class_ratio_drift"] = class_drift
 
@@ -211,7 +386,7 @@ class PredictionOutputMonitor:
             results["ks_test"] = {"ks_stat": None, "p_value": None, "drift": False}
 
         # PSI on class probabilities
-        psi_val = self._compute_psi(base.map(base_counts).values, curr.map(curr_counts).values, bins=self.psi_bins)
+        psi_val = self._compute_psi(base_probs[base_codes], curr_probs[curr_codes], bins=self.psi_bins)
         if psi_val < self.psi_thresholds[0]:
             severity = "low"
         elif psi_val < self.psi_thresholds[1]:
@@ -255,8 +430,11 @@ class PredictionOutputMonitor:
         
         return self.results
     
-    async def store_results(self):
-        """Store prediction drift results in database with LLM interpretation."""
+    async def store_results(self, db: Optional[AsyncSession] = None):
+        """
+        Store prediction drift results in database with LLM interpretation.
+        When `db` is provided the record is only added to it; the caller commits.
+        """
         # Generate LLM interpretation
         llm_msg = None
         try:
@@ -272,30 +450,125 @@ class PredictionOutputMonitor:
             print(f"Warning: Failed to generate LLM interpretation: {str(e)}")
             llm_msg = None
         
+        record = self.build_drift_record(llm_msg)
+
+        # Caller-managed session: just stage the row and let the caller commit
+        if db is not None:
+            db.add(models.PredictionDrift(**record))
+            return
+
         # Store in database
         async with AsyncSessionLocal() as db:
             try:
-                drift_record = models.PredictionDrift(
-                    project_id=self.project_id,
-                    batch_number=self.batch_no or 0,
-                    baseline_window=self.baseline_window,
-                    current_window=self.current_window,
-                    drift_results={
-                        "mean_drift": self.results.get("mean_drift"),
-                        "median_drift": self.results.get("median_drift"),
-                        "variance_drift": self.results.get("variance_drift"),
-                        "quantile_drift": self.results.get("quantile_drift")
-                    },
-                    ks_test=self.results.get("ks_test", {}),
-                    psi=self.results.get("psi", {}),
-                    alerts=self.results.get("alerts", []),
-                    overall_drift=self.results.get("overall_drift", False),
-                    llm_interpretation=llm_msg
-                )
-                db.add(drift_record)
+                db.add(models.PredictionDrift(**record))
                 await db.commit()
                 print(f"✓ Prediction Drift stored for project {self.project_id}, batch {self.batch_no}")
                 
             except Exception as e:
                 await db.rollback()
                 print(f"Error storing prediction drift: {str(e)}")
+
+    def build_drift_record(self, llm_msg: Optional[str] = None) -> Dict[str, Any]:
+        """Column values for a PredictionDrift row built from the current results."""
+        return {
+            "project_id": self.project_id,
+            "batch_number": self.batch_no or 0,
+            "baseline_window": self.baseline_window,
+            "current_window": self.current_window,
+            "drift_results": {
+                "mean_drift": self.results.get("mean_drift"),
+                "median_drift": self.results.get("median_drift"),
+                "variance_drift": self.results.get("variance_drift"),
+                "quantile_drift": self.results.get("quantile_drift")
+            },
+            "ks_test": self.results.get("ks_test", {}),
+            "psi": self.results.get("psi", {}),
+            "alerts": self.results.get("alerts", []),
+            "overall_drift": self.results.get("overall_drift", False),
+            "llm_interpretation": llm_msg
+        }
+
+
+async def bulk_store_prediction_drift(records: List[Dict[str, Any]], db: Optional[AsyncSession] = None):
+    """
+    Insert many PredictionDrift rows (see PredictionOutputMonitor.build_drift_record)
+    in one executemany round-trip and a single transaction.
+    If `db` is given the caller owns the commit.
+    """
+    if not records:
+        return
+
+    if db is not None:
+        await db.execute(insert(models.PredictionDrift), records)
+        return
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(models.PredictionDrift), records)
+        await db.commit()
+        print(f"✓ {len(records)} prediction drift records stored")
+
+
+async def load_baseline_prediction_stats(
+    project_id: int,
+    baseline_range: tuple,
+    db: AsyncSession
+) -> Optional[Dict[str, Any]]:
+    """
+    Stored baseline statistics for the project, or None if they are missing
+    or were computed from a different baseline window.
+    """
+    result = await db.execute(
+        select(models.BaselinePredictionStats).where(
+            models.BaselinePredictionStats.project_id == project_id
+        )
+    )
+    row = result.scalar_one_or_none()
+    if row is None or (row.baseline_start_row, row.baseline_end_row) != tuple(baseline_range):
+        return None
+
+    return {
+        "n": row.n,
+        "mean": row.mean,
+        "median": row.median,
+        "var": row.var,
+        "quantiles": row.quantiles,
+        "psi_bins": row.psi_bins,
+        "psi_breakpoints": row.psi_breakpoints,
+        "psi_base_proportions": row.psi_base_proportions,
+        "sorted_sample": np.frombuffer(row.sorted_sample, dtype=np.float64),
+    }
+
+
+async def store_baseline_prediction_stats(
+    project_id: int,
+    baseline_range: tuple,
+    stats: Dict[str, Any],
+    db: Optional[AsyncSession] = None
+):
+    """
+    Upsert baseline statistics (see PredictionOutputMonitor.compute_baseline_stats).
+    If `db` is given the caller owns the commit.
+    """
+    record = models.BaselinePredictionStats(
+        project_id=project_id,
+        baseline_start_row=baseline_range[0],
+        baseline_end_row=baseline_range[1],
+        n=stats["n"],
+        mean=stats["mean"],
+        median=stats["median"],
+        var=stats["var"],
+        quantiles=stats["quantiles"],
+        psi_bins=stats["psi_bins"],
+        psi_breakpoints=stats["psi_breakpoints"],
+        psi_base_proportions=stats["psi_base_proportions"],
+        sorted_sample=np.ascontiguousarray(stats["sorted_sample"], dtype=np.float64).tobytes(),
+    )
+
+    if db is not None:
+        await db.merge(record)
+        return
+
+    async with AsyncSessionLocal() as db:
+        await db.merge(record)
+        await db.commit()
+        print(f"✓ Baseline prediction stats stored for project {project_id}")
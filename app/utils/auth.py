@@ -2,23 +2,38 @@
 Authentication utilities for password hashing and session management.
 """
 import uuid
+import asyncio
 import bcrypt
 from typing import Optional
 from datetime import datetime, timedelta
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.database.models import Company, Project
 from app.database.connection import get_db
 from app.config import get_settings
+from app.constants import AUTH_CACHE_TTL_SECONDS, AUTH_CACHE_MAX_SIZE
 
 settings = get_settings()
 
+# Short-lived in-process caches for the auth hot path.
+# Session tokens map to a snapshot of the Company columns (not the ORM instance,
+# which is bound to the request's session); API keys map to company_id.
+_session_cache: TTLCache = TTLCache(maxsize=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+_api_key_cache: TTLCache = TTLCache(maxsize=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
 
-def hash_password(password: str) -> str:
+# Company columns kept in a session snapshot: what the auth dependencies and
+# /auth/me read. The password hash is deliberately left out of process memory.
+_SESSION_CACHE_FIELDS = ("company_id", "name", "email", "company_name", "api_key", "session_token")
+
+
+async def hash_password(password: str) -> str:
     """
     Hash a password using bcrypt.
+    bcrypt is deliberately slow, so it runs in the thread pool to keep the event loop free.
     
     Args:
         password: Plain text password
@@ -27,13 +42,14 @@ def hash_password(password: str) -> str:
         Hashed password string
     """
     salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+    loop = asyncio.get_running_loop()
+    hashed = await loop.run_in_executor(None, bcrypt.hashpw, password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a password against its hash.
+    Verify a password against its hash (offloaded to the thread pool, see hash_password).
     
     Args:
         plain_password: Plain text password to verify
@@ -42,7 +58,10 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return bcrypt.checkpw(
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        bcrypt.checkpw,
         plain_password.encode('utf-8'),
         hashed_password.encode('utf-8')
     )
@@ -58,6 +77,84 @@ def generate_session_token() -> str:
     return uuid.uuid4().hex
 
 
+def invalidate_auth_cache(
+    session_token: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> None:
+    """
+    Drop cached lookups for a session token and/or API key.
+    Must be called whenever either credential is changed or revoked.
+    
+    Args:
+        session_token: Session token to evict
+        api_key: API key to evict
+    """
+    if session_token:
+        _session_cache.pop(session_token, None)
+    if api_key:
+        _api_key_cache.pop(api_key, None)
+
+
+def get_cached_company_id(
+    session_token: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> Optional[int]:
+    """
+    Return the cached company_id for a session token or API key, if any.
+    The session token is checked first.
+    """
+    if session_token:
+        cached = _session_cache.get(session_token)
+        if cached is not None:
+            return cached["company_id"]
+    if api_key:
+        return _api_key_cache.get(api_key)
+    return None
+
+
+def cache_company(
+    company: Company,
+    session_token: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> None:
+    """
+    Remember a company that was just authenticated by session token and/or API key.
+    """
+    if session_token:
+        _session_cache[session_token] = {
+            key: getattr(company, key) for key in _SESSION_CACHE_FIELDS
+        }
+    if api_key:
+        _api_key_cache[api_key] = company.company_id
+
+
+async def _get_company_by_session_token(
+    session_token: str,
+    db: AsyncSession
+) -> Optional[Company]:
+    """
+    Look up the company for a session token, serving repeat lookups from cache.
+    Cache hits are merged into `db` without a query so callers can still modify
+    and commit the returned object; columns outside the snapshot (the password
+    hash) are left unloaded.
+    """
+    cached = _session_cache.get(session_token)
+    if cached is not None:
+        company = Company(**cached)
+        make_transient_to_detached(company)
+        return await db.merge(company, load=False)
+
+    result = await db.execute(
+        select(Company).where(Company.session_token == session_token)
+    )
+    company = result.scalar_one_or_none()
+    
+    if company:
+        cache_company(company, session_token=session_token)
+    
+    return company
+
+
 async def get_current_user(
     session_token: Optional[str] = Header(None, alias="session_token"),
     db: AsyncSession = Depends(get_db)
@@ -80,10 +177,7 @@ async def get_current_user(
             status_code=401,
             detail="Session token is missing"
         )
-    result = await db.execute(
-        select(Company).where(Company.session_token == session_token)
-    )
-    user = result.scalar_one_or_none()
+    user = await _get_company_by_session_token(session_token, db)
     
     if not user:
         raise HTTPException(
@@ -111,10 +205,7 @@ async def get_current_user_from_query(
     Raises:
         HTTPException: If token is invalid
     """
-    result = await db.execute(
-        select(Company).where(Company.session_token == session_token)
-    )
-    user = result.scalar_one_or_none()
+    user = await _get_company_by_session_token(session_token, db)
     
     if not user:
         raise HTTPException(
@@ -156,18 +247,23 @@ async def verify_api_key(
             detail="API key is missing. Please provide X-API-Key or Authorization: Bearer header."
         )
     
+    company_id = _api_key_cache.get(token)
+    if company_id is not None:
+        return company_id
+    
     result = await db.execute(
-        select(Company).where(Company.api_key == token)
+        select(Company.company_id).where(Company.api_key == token)
     )
-    company = result.scalar_one_or_none()
+    company_id = result.scalar_one_or_none()
     
-    if not company:
+    if company_id is None:
         raise HTTPException(
             status_code=401,
             detail="Invalid API key"
         )
     
-    return company.company_id
+    _api_key_cache[token] = company_id
+    return company_id
 
 
 async def get_current_project(
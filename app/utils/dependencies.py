@@ -1,10 +1,10 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Header
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, or_
 from app.database.connection import get_db
 from app.database import models
-from app.utils.auth import get_current_user, verify_api_key
+from app.utils.auth import get_cached_company_id, cache_company
 
 async def get_company_id_hybrid(
     api_key: Optional[str] = Header(None, alias="X-API-Key"),
@@ -14,35 +14,48 @@ async def get_company_id_hybrid(
 ) -> int:
     """
     Authenticate utilizing either Session Token, X-API-Key, or Bearer Token.
+    Precedence: Session Token (Frontend) > X-API-Key (Legacy SDK) > Bearer Token (New SDK).
     Returns: company_id
     """
-    # 1. Try Session Token (Frontend)
+    bearer_token = None
+    if authorization and authorization.startswith("Bearer "):
+        # Bearer token is treated as an API key (simpler than separate oauth)
+        bearer_token = authorization.split(" ")[1]
+
+    # Fast path: the highest-precedence credential supplied was seen recently.
+    # A cached lower-precedence credential must not win over a higher one that
+    # isn't cached yet, so those cases go through the lookup below.
     if session_token:
-        try:
-            user = await get_current_user(session_token=session_token, db=db)
-            return user.company_id
-        except HTTPException:
-            pass # Fall through to other methods
+        company_id = get_cached_company_id(session_token=session_token)
+    else:
+        company_id = get_cached_company_id(api_key=api_key or bearer_token)
+    if company_id is not None:
+        return company_id
 
-    # 2. Try X-API-Key (Legacy SDK)
-    if api_key:
-        try:
-            return await verify_api_key(api_key=api_key, db=db)
-        except HTTPException:
-            pass
+    # Single round-trip covering every supplied credential
+    conditions = []
+    if session_token:
+        conditions.append(models.Company.session_token == session_token)
+    api_keys = [key for key in (api_key, bearer_token) if key]
+    if api_keys:
+        conditions.append(models.Company.api_key.in_(api_keys))
 
-    # 3. Try Bearer Token (New SDK)
-    if authorization and authorization.startswith("Bearer "):
-        token = authorization.split(" ")[1]
-        # Treat bearer token as API Key for now (simpler logic than separate oauth)
-        # OR verify_api_key logic should be reused.
-        # Let's verify it against Company.api_key
+    if conditions:
         result = await db.execute(
-            select(models.Company).where(models.Company.api_key == token)
+            select(models.Company).where(or_(*conditions))
         )
-        company = result.scalar_one_or_none()
-        if company:
-            return company.company_id
+        companies = result.scalars().all()
+
+        # Dispatch on which column matched, honouring the precedence above
+        for company in companies:
+            if session_token and company.session_token == session_token:
+                cache_company(company, session_token=session_token)
+                return company.company_id
+        for key in api_keys:
+            for company in companies:
+                if company.api_key == key:
+                    cache_company(company, api_key=key)
+                    return company.company_id
 
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,8 +1,14 @@
-import asyncio
+import numpy as np
 import pandas as pd
+from contextlib import asynccontextmanager
+from typing import Optional
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import models
-from app.database.connection import get_db, AsyncSessionLocal
+from app.database.connection import AsyncSessionLocal
+
+STREAM_BATCH_SIZE = 1000  # Rows fetched per round-trip when streaming JSON rows
+MAX_EXACT_FLOAT_INT = 2 ** 53  # Larger ints can't round-trip through a float64 column
 
 
 class ProjectDataFetcher:
@@ -11,12 +17,153 @@ class ProjectDataFetcher:
     and return them as pandas DataFrames.
     """
 
-    def __init__(self, project_id: int):
+    def __init__(self, project_id: int, db: Optional[AsyncSession] = None):
         self.project_id = project_id
+        self.db = db
+
+    @asynccontextmanager
+    async def _session(self, db: Optional[AsyncSession] = None):
+        """Yield the given/owned session, or open a short-lived one if neither exists."""
+        db = db if db is not None else self.db
+        if db is not None:
+            yield db
+        else:
+            async with AsyncSessionLocal() as session:
+                yield session
+
+    @staticmethod
+    async def _stream_json_rows(db, stmt) -> pd.DataFrame:
+        """
+        Stream (row_id, json_value) rows straight into per-column lists and build
+        the DataFrame once. Missing keys and nulls become np.nan as they arrive,
+        so no full-frame replace pass is needed afterwards.
+        """
+        result = await db.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        columns = {}
+        row_ids = []
+        async for row_id, values in result:
+            n = len(row_ids)
+            # Mirror pd.DataFrame(list_of_records) for non-dict JSON values
+            if isinstance(values, dict):
+                items = values.items()
+            elif isinstance(values, (list, tuple)):
+                items = enumerate(values)
+            else:
+                items = ((0, values),)
+
+            for key, value in items:
+                col = columns.get(key)
+                if col is None:
+                    col = columns[key] = [np.nan] * n  # backfill earlier rows
+                col.append(np.nan if value is None else value)
+            row_ids.append(row_id)
+
+            # Pad columns this row didn't have
+            for col in columns.values():
+                if len(col) == n:
+                    col.append(np.nan)
+
+        df = pd.DataFrame(columns)
+        df["row_id"] = row_ids
+        return df
+
+    @staticmethod
+    def _schema_dtype_kind(dtype_name: str) -> str:
+        """numpy dtype kind for a stored pandas dtype string ('O' for non-numpy types like 'str')."""
+        try:
+            return np.dtype(dtype_name).kind
+        except TypeError:
+            return "O"
+
+    @staticmethod
+    def _to_object(arr: np.ndarray, n: int, is_int: bool) -> np.ndarray:
+        """Object copy of a float64 column; values filled so far in an int column stay ints."""
+        obj = arr.astype(object)
+        if is_int:
+            filled = np.flatnonzero(~np.isnan(arr[:n]))
+            obj[filled] = arr[filled].astype(np.int64).astype(object)
+        return obj
+
+    @classmethod
+    async def _stream_json_rows_typed(cls, db, stmt, schema: dict, capacity: int) -> pd.DataFrame:
+        """
+        Stream (row_id, features) rows into preallocated per-column arrays.
+        Numeric schema columns are filled as contiguous float64 (NaN for missing),
+        everything else as object. `capacity` is an upper bound on the row count.
+        A value whose Python type doesn't fit its numeric column (a string, a bool,
+        an int beyond float64's exact range) turns that column into object, so
+        values come out as stored, as with _stream_json_rows.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        arrays = {}
+        numeric = {}  # column -> "i" or "f" while it is still stored as float64
+        for col, dtype_name in schema.items():
+            kind = cls._schema_dtype_kind(dtype_name)
+            if kind in "iuf":
+                arrays[col] = np.full(capacity, np.nan, dtype=np.float64)
+                numeric[col] = "f" if kind == "f" else "i"
+            else:
+                arrays[col] = np.full(capacity, np.nan, dtype=object)
+        row_ids = np.empty(capacity, dtype=np.int64)
+
+        result = await db.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        n = 0
+        async for row_id, values in result:
+            if n == capacity:
+                # Capacity was only an estimate; grow geometrically
+                capacity *= 2
+                row_ids = np.resize(row_ids, capacity)
+                for col, arr in arrays.items():
+                    grown = np.full(capacity, np.nan, dtype=arr.dtype)
+                    grown[:n] = arr[:n]
+                    arrays[col] = grown
+            row_ids[n] = row_id
+            for key, value in (values or {}).items():
+                if value is None:
+                    continue
+                arr = arrays.get(key)
+                if arr is None:
+                    # Column not in the stored schema
+                    arr = arrays[key] = np.full(capacity, np.nan, dtype=object)
+                kind = numeric.get(key)
+                if kind is not None:
+                    # numpy would coerce "3.5" or True into float64 instead of
+                    # raising, so check the Python type before storing
+                    value_type = type(value)
+                    if value_type is float:
+                        if kind == "i":
+                            numeric[key] = "f"  # mixed ints and floats: a float column
+                    elif value_type is not int or not -MAX_EXACT_FLOAT_INT <= value <= MAX_EXACT_FLOAT_INT:
+                        arr = arrays[key] = cls._to_object(arr, n, kind == "i")
+                        del numeric[key]
+                arr[n] = value
+            n += 1
+
+        columns = {col: arr[:n] for col, arr in arrays.items()}
+        for col, kind in numeric.items():
+            # Restore integer dtype when nothing was missing
+            if kind == "i" and not np.isnan(columns[col]).any():
+                columns[col] = columns[col].astype(np.int64)
 
-    async def fetch_data_stats(self):
+        df = pd.DataFrame(columns, copy=False).infer_objects()
+        df["row_id"] = row_ids[:n]
+        return df
+
+    async def fetch_feature_schema(self, db: Optional[AsyncSession] = None) -> Optional[dict]:
+        """Fetch the stored column -> dtype mapping from FeatureValidationParams"""
+        async with self._session(db) as db:
+            result = await db.execute(
+                select(models.FeatureValidationParams.columns_type).where(
+                    models.FeatureValidationParams.project_id == self.project_id
+                )
+            )
+            return result.scalars().first()
+
+    async def fetch_data_stats(self, db: Optional[AsyncSession] = None):
         """Fetch latest feature/prediction row ranges from FeatureStats"""
-        async with AsyncSessionLocal() as db:
+        async with self._session(db) as db:
             try:
                 result = await db.execute(
                     select(models.FeatureStats).where(
@@ -38,9 +185,10 @@ class ProjectDataFetcher:
                 print(f"Error fetching feature stats: {e}")
                 return None
 
-    async def fetch_feature_input(self) -> pd.DataFrame:
-        """Fetch feature input data as a DataFrame"""
-        stats = await self.fetch_data_stats()
+    async def fetch_feature_input(self, stats: dict = None, db: Optional[AsyncSession] = None) -> pd.DataFrame:
+        """Fetch feature input data as a DataFrame (pass `stats` to skip re-fetching them)"""
+        if stats is None:
+            stats = await self.fetch_data_stats(db)
         if not stats:
             raise ValueError(f"No stats found for project {self.project_id}")
 
@@ -50,25 +198,21 @@ class ProjectDataFetcher:
         if start_row is None or end_row is None:
             return pd.DataFrame()
             
-        async for db in get_db():
-            result = await db.execute(
-                select(models.FeatureInput).where(
-                    models.FeatureInput.project_id == self.project_id,
-                    models.FeatureInput.row_id.between(start_row, end_row)
-                )
-            )
-            rows = result.scalars().all()
-            # Convert JSON features to dict and then to DataFrame
-            data = [row.features for row in rows]
-            df = pd.DataFrame(data)
-            # Convert None to np.nan for proper pandas handling
-            df = df.replace({None: pd.NA})
-            df["row_id"] = [row.row_id for row in rows]
-            return df
-
-    async def fetch_prediction_output(self) -> pd.DataFrame:
-        """Fetch prediction output data as a DataFrame"""
-        stats = await self.fetch_data_stats()
+        async with self._session(db) as db:
+            stmt = select(models.FeatureInput.row_id, models.FeatureInput.features).where(
+                models.FeatureInput.project_id == self.project_id,
+                models.FeatureInput.row_id.between(start_row, end_row)
+            ).order_by(models.FeatureInput.row_id)
+            # With a known schema, fill typed columns directly; otherwise infer as we go
+            schema = await self.fetch_feature_schema(db)
+            if schema and end_row >= start_row:
+                return await self._stream_json_rows_typed(db, stmt, schema, capacity=end_row - start_row + 1)
+            return await self._stream_json_rows(db, stmt)
+
+    async def fetch_prediction_output(self, stats: dict = None, db: Optional[AsyncSession] = None) -> pd.DataFrame:
+        """Fetch prediction output data as a DataFrame (pass `stats` to skip re-fetching them)"""
+        if stats is None:
+            stats = await self.fetch_data_stats(db)
         if not stats:
             raise ValueError(f"No stats found for project {self.project_id}")
 
@@ -78,27 +222,21 @@ class ProjectDataFetcher:
         if start_row is None or end_row is None:
             return pd.DataFrame()
             
-        async for db in get_db():
-            result = await db.execute(
-                select(models.PredictionOutput).where(
-                    models.PredictionOutput.project_id == self.project_id,
-                    models.PredictionOutput.row_id.between(start_row, end_row)
-                )
-            )
-            rows = result.scalars().all()
-            # Convert JSON predictions to dict and then to DataFrame
-            data = [row.prediction for row in rows]
-            df = pd.DataFrame(data)
-            # Convert None to np.nan for proper pandas handling
-            df = df.replace({None: pd.NA})
-            df["row_id"] = [row.row_id for row in rows]
-            return df
+        async with self._session(db) as db:
+            stmt = select(models.PredictionOutput.row_id, models.PredictionOutput.prediction).where(
+                models.PredictionOutput.project_id == self.project_id,
+                models.PredictionOutput.row_id.between(start_row, end_row)
+            ).order_by(models.PredictionOutput.row_id)
+            return await self._stream_json_rows(db, stmt)
     
     async def get_feature_and_prediction_data(self):
         """Fetch features, predictions, and metadata"""
-        stats = await self.fetch_data_stats()
-        feature_df = await self.fetch_feature_input()
-        predicted_df = await self.fetch_prediction_output()
+        # One session (and pooled connection) for all three queries; a single
+        # AsyncSession can't run statements concurrently, so they go in sequence.
+        async with self._session() as db:
+            stats = await self.fetch_data_stats(db)
+            feature_df = await self.fetch_feature_input(stats, db)
+            predicted_df = await self.fetch_prediction_output(stats, db)
 
         return {
             'features': feature_df,
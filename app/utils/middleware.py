@@ -0,0 +1,57 @@
+"""
+ASGI middleware for request handling.
+"""
+import zlib
+
+from starlette.responses import PlainTextResponse
+
+from app.constants import MAX_DECOMPRESSED_BODY_BYTES
+
+
+class GzipRequestMiddleware:
+    """
+    Decompress gzip-encoded request bodies before they reach the routes.
+    The SDK gzips large ingestion batches; routes keep reading plain JSON.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or dict(scope["headers"]).get(b"content-encoding") != b"gzip":
+            await self.app(scope, receive, send)
+            return
+
+        # Read the whole compressed body
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+
+        # Bounded inflate so a tiny compressed body can't expand without limit
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(b"".join(chunks), MAX_DECOMPRESSED_BODY_BYTES)
+        except zlib.error:
+            await PlainTextResponse("Invalid gzip request body", status_code=400)(scope, receive, send)
+            return
+        if decompressor.unconsumed_tail:
+            await PlainTextResponse("Request body too large", status_code=413)(scope, receive, send)
+            return
+
+        headers = [(k, v) for k, v in scope["headers"] if k not in (b"content-encoding", b"content-length")]
+        headers.append((b"content-length", str(len(body)).encode()))
+        body_sent = False
+
+        async def receive_body():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(dict(scope, headers=headers), receive_body, send)
@@ -3,43 +3,34 @@ Statistics aggregation utilities for project metrics.
 Provides helper functions to calculate and aggregate statistics from database.
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from sqlalchemy import select, func, and_, tuple_, true, bindparam, cast, Float, Numeric
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 from app.database import models
+from app.database.materialized_views import project_overview_mv, llm_drift_mv
 
 
-async def get_project_overview_stats(
-    db: AsyncSession,
-    project_id: int
-) -> Dict:
-    """
-    Get overview statistics for a project.
-    
-    Returns:
-        Dict with total_tests, pass_rate, fail_rate, avg_response_time
-    """
-    # Get total quality checks
-    result = await db.execute(
-        select(func.count(models.FeatureQualityCheck.id))
-        .where(models.FeatureQualityCheck.project_id == project_id)
-    )
-    total_tests = result.scalar() or 0
-    
-    # Get passed tests
-    result = await db.execute(
-        select(func.count(models.FeatureQualityCheck.id))
-        .where(
-            and_(
-                models.FeatureQualityCheck.project_id == project_id,
-                models.FeatureQualityCheck.status == "passed"
-            )
-        )
+def _rate(part, total):
+    """Percentage of `total`, rounded to 2 places by Postgres; 0 when total is 0."""
+    # numeric arithmetic: Postgres only has round(numeric, int), not round(float8, int)
+    return cast(func.coalesce(func.round(cast(part, Numeric) * 100 / func.nullif(total, 0), 2), 0), Float)
+
+
+# Hot dashboard statements are built once at import with a bound project_id,
+# so each call reuses the same Select (and its compiled form) instead of rebuilding it
+
+# Total and passed quality checks (precomputed per project, see materialized_views)
+_OVERVIEW_COUNTS = (
+    select(
+        project_overview_mv.c.total_tests,
+        project_overview_mv.c.passed_tests,
+        _rate(project_overview_mv.c.passed_tests, project_overview_mv.c.total_tests).label("pass_rate")
     )
-    passed_tests = result.scalar() or 0
-    
-    # Calculate rates
-    pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
+    .where(project_overview_mv.c.project_id == bindparam("project_id"))
+)
+
+
+def _overview_stats(total_tests: int, passed_tests: int, pass_rate: float) -> Dict:
     fail_rate = 100 - pass_rate
     
     # Get average response time (placeholder - would need actual timing data)
@@ -49,45 +40,98 @@ async def get_project_overview_stats(
         "total_tests": total_tests,
         "passed_tests": passed_tests,
         "failed_tests": total_tests - passed_tests,
-        "pass_rate": round(pass_rate, 2),
+        "pass_rate": pass_rate,
         "fail_rate": round(fail_rate, 2),
         "avg_response_time": avg_response_time
     }
 
 
+async def get_project_overview_stats(
+    db: AsyncSession,
+    project_id: int
+) -> Dict:
+    """
+    Get overview statistics for a project.
+    
+    Returns:
+        Dict with total_tests, pass_rate, fail_rate, avg_response_time
+    """
+    result = await db.execute(_OVERVIEW_COUNTS, {"project_id": project_id})
+    return _overview_stats(*(result.one_or_none() or (0, 0, 0.0)))
+
+
+# Latest quality check and check count; changes whenever a check is added or removed.
+# check_timestamp is the checks' real column (covered by the project/timestamp index).
+_QUALITY_CHECKS_VERSION = (
+    select(
+        func.max(models.FeatureQualityCheck.check_timestamp),
+        func.count()
+    )
+    .where(models.FeatureQualityCheck.project_id == bindparam("project_id"))
+)
+
+
+async def get_quality_checks_version(
+    db: AsyncSession,
+    project_id: int
+) -> Tuple[Optional[datetime], int]:
+    """
+    Get a cheap change marker for a project's quality checks.
+    
+    Returns:
+        Tuple of (latest check_timestamp or None, number of checks)
+    """
+    result = await db.execute(_QUALITY_CHECKS_VERSION, {"project_id": project_id})
+    return tuple(result.one())
+
+
 async def get_test_history(
     db: AsyncSession,
     project_id: int,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[datetime] = None,
+    cursor_id: Optional[int] = None
 ) -> List[Dict]:
     """
     Get test history for a project with pagination.
     
+    Args:
+        cursor, cursor_id: check_timestamp and id of the last record already seen;
+            when given, the page starts right after it and `offset` is ignored
+    
     Returns:
         List of test records with details
     """
-    result = await db.execute(
-        select(models.FeatureQualityCheck)
-        .where(models.FeatureQualityCheck.project_id == project_id)
-        .order_by(models.FeatureQualityCheck.created_at.desc())
+    # Column projection: plain rows, no ORM instances to hydrate
+    qc = models.FeatureQualityCheck
+    stmt = (
+        select(
+            qc.id,
+            qc.batch_number,
+            qc.check_status,
+            qc.total_rows_checked,
+            qc.missing_values_summary,
+            qc.columns_with_missing,
+            qc.total_duplicate_rows,
+            qc.duplicate_percentage,
+            qc.error_message,
+            qc.check_timestamp
+        )
+        .where(qc.project_id == project_id)
+        .order_by(qc.check_timestamp.desc(), qc.id.desc())
         .limit(limit)
-        .offset(offset)
     )
-    tests = result.scalars().all()
+    # Keyset pagination seeks straight to the next page instead of skipping `offset` rows
+    if cursor is not None and cursor_id is not None:
+        stmt = stmt.where(tuple_(qc.check_timestamp, qc.id) < tuple_(cursor, cursor_id))
+    else:
+        stmt = stmt.offset(offset)
+    result = await db.execute(stmt)
     
     return [
-        {
-            "id": test.id,
-            "batch_number": test.batch_number,
-            "status": test.status,
-            "missing_values": test.missing_values,
-            "duplicates": test.duplicates,
-            "outliers": test.outliers,
-            "error_message": test.error_message,
-            "created_at": test.created_at.isoformat() if test.created_at else None
-        }
-        for test in tests
+        {**test, "check_timestamp": test["check_timestamp"].isoformat() if test["check_timestamp"] else None}
+        for test in result.mappings()
     ]
 
 
@@ -102,48 +146,73 @@ async def get_time_series_stats(
     Returns:
         List of daily statistics with date, total_tests, passed, failed
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    # Naive UTC, matching the TIMESTAMP (without time zone) columns, so the
+    # comparison needs no cast and can use the (project_id, check_timestamp) index
+    cutoff_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)
     
-    # Get all tests within the time range
+    # Bucket by day in the database; only one row per day comes back.
+    # The ORDER BY sorts those few grouped rows, not the raw checks, and is
+    # the only ordering the output gets.
+    day = func.date_trunc("day", models.FeatureQualityCheck.check_timestamp).label("day")
+    # Ingestion records a check as "completed" or "failed"
+    passed = func.count().filter(models.FeatureQualityCheck.check_status == "completed")
     result = await db.execute(
-        select(models.FeatureQualityCheck)
+        select(
+            day,
+            func.count().label("total"),
+            passed.label("passed"),
+            _rate(passed, func.count()).label("pass_rate")
+        )
         .where(
             and_(
                 models.FeatureQualityCheck.project_id == project_id,
-                models.FeatureQualityCheck.created_at >= cutoff_date
+                models.FeatureQualityCheck.check_timestamp >= cutoff_date
             )
         )
-        .order_by(models.FeatureQualityCheck.created_at)
+        .group_by(day)
+        .order_by(day)
     )
-    tests = result.scalars().all()
-    
-    # Group by date
-    daily_stats = {}
-    for test in tests:
-        if test.created_at:
-            date_key = test.created_at.date().isoformat()
-            if date_key not in daily_stats:
-                daily_stats[date_key] = {"total": 0, "passed": 0, "failed": 0}
-            
-            daily_stats[date_key]["total"] += 1
-            if test.status == "passed":
-                daily_stats[date_key]["passed"] += 1
-            else:
-                daily_stats[date_key]["failed"] += 1
     
-    # Convert to list format
     return [
         {
-            "date": date,
-            "total_tests": stats["total"],
-            "passed": stats["passed"],
-            "failed": stats["failed"],
-            "pass_rate": round((stats["passed"] / stats["total"] * 100) if stats["total"] > 0 else 0, 2)
+            "date": row.day.date().isoformat(),
+            "total_tests": row.total,
+            "passed": row.passed,
+            "failed": row.total - row.passed,
+            "pass_rate": row.pass_rate
         }
-        for date, stats in sorted(daily_stats.items())
+        for row in result
     ]
 
 
+# Total and passed validations; an ungrouped aggregate, so always exactly one row
+def _validation_counts_stmt():
+    total = func.count(models.FeatureValidation.id)
+    passed = func.count(models.FeatureValidation.id).filter(
+        models.FeatureValidation.validation_status == True
+    )
+    return (
+        select(
+            total.label("total_validations"),
+            passed.label("passed_validations"),
+            _rate(passed, total).label("validation_pass_rate")
+        )
+        .where(models.FeatureValidation.project_id == bindparam("project_id"))
+    )
+
+
+_VALIDATION_COUNTS = _validation_counts_stmt()
+
+
+def _validation_stats(total_validations: int, passed_validations: int, validation_pass_rate: float) -> Dict:
+    return {
+        "total_validations": total_validations,
+        "passed_validations": passed_validations,
+        "failed_validations": total_validations - passed_validations,
+        "validation_pass_rate": validation_pass_rate
+    }
+
+
 async def get_validation_stats(
     db: AsyncSession,
     project_id: int
@@ -154,28 +223,27 @@ async def get_validation_stats(
     Returns:
         Dict with validation metrics
     """
-    result = await db.execute(
-        select(func.count(models.FeatureValidation.id))
-        .where(models.FeatureValidation.project_id == project_id)
-    )
-    total_validations = result.scalar() or 0
-    
-    result = await db.execute(
-        select(func.count(models.FeatureValidation.id))
-        .where(
-            and_(
-                models.FeatureValidation.project_id == project_id,
-                models.FeatureValidation.validation_status == True
-            )
-        )
+    result = await db.execute(_VALIDATION_COUNTS, {"project_id": project_id})
+    return _validation_stats(*result.one())
+
+
+# Total and drifted LLM drift checks (precomputed per project, see materialized_views)
+_DRIFT_COUNTS = (
+    select(
+        llm_drift_mv.c.total_drift_checks,
+        llm_drift_mv.c.drift_detected,
+        _rate(llm_drift_mv.c.drift_detected, llm_drift_mv.c.total_drift_checks).label("drift_rate")
     )
-    passed_validations = result.scalar() or 0
-    
+    .where(llm_drift_mv.c.project_id == bindparam("project_id"))
+)
+
+
+def _drift_stats(total_drift_checks: int, drift_detected: int, drift_rate: float) -> Dict:
     return {
-        "total_validations": total_validations,
-        "passed_validations": passed_validations,
-        "failed_validations": total_validations - passed_validations,
-        "validation_pass_rate": round((passed_validations / total_validations * 100) if total_validations > 0 else 0, 2)
+        "total_drift_checks": total_drift_checks,
+        "drift_detected": drift_detected,
+        "no_drift": total_drift_checks - drift_detected,
+        "drift_rate": drift_rate
     }
 
 
@@ -189,27 +257,51 @@ async def get_drift_detection_stats(
     Returns:
         Dict with drift metrics
     """
-    # Get LLM drift stats
-    result = await db.execute(
-        select(func.count(models.LLMDrift.id))
-        .where(models.LLMDrift.project_id == project_id)
-    )
-    total_drift_checks = result.scalar() or 0
+    result = await db.execute(_DRIFT_COUNTS, {"project_id": project_id})
+    return _drift_stats(*(result.one_or_none() or (0, 0, 0.0)))
+
+
+def _dashboard_counts_stmt():
+    overview = _OVERVIEW_COUNTS.cte("overview")
+    validation = _VALIDATION_COUNTS.cte("validation")
+    drift = _DRIFT_COUNTS.cte("drift")
     
-    result = await db.execute(
-        select(func.count(models.LLMDrift.id))
-        .where(
-            and_(
-                models.LLMDrift.project_id == project_id,
-                models.LLMDrift.has_drift == True
-            )
+    # The validation aggregate always yields one row; the view lookups may yield none
+    return (
+        select(
+            func.coalesce(overview.c.total_tests, 0),
+            func.coalesce(overview.c.passed_tests, 0),
+            func.coalesce(overview.c.pass_rate, 0.0),
+            validation.c.total_validations,
+            validation.c.passed_validations,
+            validation.c.validation_pass_rate,
+            func.coalesce(drift.c.total_drift_checks, 0),
+            func.coalesce(drift.c.drift_detected, 0),
+            func.coalesce(drift.c.drift_rate, 0.0)
+        )
+        .select_from(
+            validation
+            .outerjoin(overview, true())
+            .outerjoin(drift, true())
         )
     )
-    drift_detected = result.scalar() or 0
+
+
+_DASHBOARD_COUNTS = _dashboard_counts_stmt()
+
+
+async def get_dashboard_stats(
+    db: AsyncSession,
+    project_id: int
+) -> Tuple[Dict, Dict, Dict]:
+    """
+    Get overview, validation and drift statistics in a single query.
     
-    return {
-        "total_drift_checks": total_drift_checks,
-        "drift_detected": drift_detected,
-        "no_drift": total_drift_checks - drift_detected,
-        "drift_rate": round((drift_detected / total_drift_checks * 100) if total_drift_checks > 0 else 0, 2)
-    }
+    Returns:
+        Tuple of (overview, validation, drift) dicts, as returned by the
+        individual get_*_stats functions
+    """
+    result = await db.execute(_DASHBOARD_COUNTS, {"project_id": project_id})
+    row = result.one()
+    
+    return _overview_stats(*row[0:3]), _validation_stats(*row[3:6]), _drift_stats(*row[6:9])
@@ -5,11 +5,19 @@ Main FastAPI application entry point
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
+import tempfile
+from jinja2 import FileSystemBytecodeCache
 from contextlib import asynccontextmanager
+import asyncio
+from app.config import get_settings
 from app.database.connection import init_db
+from app.database.materialized_views import create_materialized_views, refresh_materialized_views_periodically
+from app.constants import STATS_VIEW_REFRESH_SECONDS
+from app.services.llm_monitoring.llm_model_init import start_inference_pool, shutdown_inference_pool
+from app.utils.middleware import GzipRequestMiddleware
 from app.routes import auth, get_api, projects, ingest, data_quality, data_validation, drift_detection, llm_monitoring, statistics, project_stats, feature_monitoring, prediction_monitoring
 
 
@@ -19,20 +27,31 @@ async def lifespan(app: FastAPI):
     Lifespan events for the FastAPI application.
     Handles startup and shutdown logic.
     """
-    # Startup: Initialize database tables
+    # Startup: Initialize database tables and the statistics views built on them
     await init_db()
+    await create_materialized_views()
+    refresh_task = asyncio.create_task(
+        refresh_materialized_views_periodically(STATS_VIEW_REFRESH_SECONDS)
+    )
+    # Load LLM models in a worker process that also serves toxicity inference
+    start_inference_pool()
     yield
-    # Shutdown: Clean up resources if needed
+    # Shutdown: Stop the view refresh loop and the inference worker
+    refresh_task.cancel()
+    shutdown_inference_pool()
 
 
 app = FastAPI(
     title="Watchtower AI API",
     description="Advanced data drift detection and quality monitoring system",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # ... middleware ...
+# Inflate gzip-encoded request bodies (large SDK ingestion batches)
+app.add_middleware(GzipRequestMiddleware)
 
 # Include routers
 app.include_router(auth.router)
@@ -58,6 +77,12 @@ async def health_check():
 # Configure Jinja2 templates
 frontend_path = Path(__file__).parent / "frontend"
 templates = Jinja2Templates(directory=str(frontend_path / "templates"))
+# Templates only change on deploy: skip the per-request mtime check (except in debug)
+# and keep compiled bytecode on disk so workers don't recompile on startup
+templates.env.auto_reload = get_settings().debug
+_jinja_cache_dir = Path(tempfile.gettempdir()) / "watchtower_jinja_cache"
+_jinja_cache_dir.mkdir(exist_ok=True)
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(_jinja_cache_dir))
 
 # Mount static files (CSS, JS, assets)
 if frontend_path.exists():
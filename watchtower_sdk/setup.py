@@ -14,8 +14,14 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.25.0",
+        "httpx>=0.24.0",
+        "orjson>=3.9.0",
         "pandas>=1.0.0",
         "numpy>=1.19.0"
     ],
+    extras_require={
+        "arrow": ["pyarrow>=14.0.0"],
+        "http2": ["httpx[http2]>=0.24.0"]
+    },
     python_requires=">=3.8",
 )
@@ -0,0 +1,76 @@
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class IngestServer:
+    """Local stand-in for the Watchtower API that records every request body."""
+
+    def __init__(self):
+        self.requests = []
+        self.received = threading.Condition()
+        # Requests whose rows contain {"gate": ...} wait here until it is set
+        self.gate = threading.Event()
+        self.gate.set()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.endpoint = f"http://127.0.0.1:{self._server.server_port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                payload = json.loads(body)
+                with server.received:
+                    server.requests.append((self.path, payload))
+                    server.received.notify_all()
+                if any("gate" in row for row in payload.get("features") or []):
+                    server.gate.wait(5)
+                response = b'{"status": "ok"}'
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def wait_for(self, n_requests, timeout=5.0):
+        """Block until at least `n_requests` requests arrived; return all of them."""
+        deadline = time.monotonic() + timeout
+        with self.received:
+            while len(self.requests) < n_requests:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.received.wait(remaining)
+            return list(self.requests)
+
+    def rows(self):
+        """Feature rows received so far, in arrival order."""
+        return [row for _, payload in self.requests for row in payload.get("features") or []]
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.gate.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def server():
+    srv = IngestServer()
+    srv.start()
+    yield srv
+    srv.stop()
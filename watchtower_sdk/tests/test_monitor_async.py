@@ -0,0 +1,119 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from watchtower.monitor import WatchtowerInputMonitor
+
+
+def _monitor(server, **kwargs):
+    return WatchtowerInputMonitor("proj", api_key="key", endpoint=server.endpoint, use_arrow=False, **kwargs)
+
+
+def _payloads(server):
+    return [payload for _, payload in server.requests]
+
+
+def test_log_async_merges_calls_into_one_request(server):
+    monitor = _monitor(server, batch_size=3, flush_interval=30)
+
+    async def run():
+        for i in range(3):
+            await monitor.log_async({"a": i})
+        await monitor.flush()
+        await monitor.aclose()
+
+    asyncio.run(run())
+
+    assert [p["features"] for p in _payloads(server)] == [[{"a": 0}, {"a": 1}, {"a": 2}]]
+
+
+def test_log_async_splits_on_stage_and_metadata(server):
+    monitor = _monitor(server, batch_size=4, flush_interval=30)
+
+    async def run():
+        await monitor.log_async({"a": 1})
+        await monitor.log_async({"a": 2}, stage="model_output")
+        await monitor.log_async({"a": 3}, stage="model_output")
+        await monitor.log_async({"a": 4}, stage="model_output", metadata={"env": "prod"})
+        await monitor.aclose()
+
+    asyncio.run(run())
+
+    assert [(p["stage"], p["metadata"], p["features"]) for p in _payloads(server)] == [
+        ("model_input", {}, [{"a": 1}]),
+        ("model_output", {}, [{"a": 2}, {"a": 3}]),
+        ("model_output", {"env": "prod"}, [{"a": 4}]),
+    ]
+
+
+def test_log_async_keeps_explicit_event_times(server):
+    monitor = _monitor(server, batch_size=3, flush_interval=30)
+    first, second = datetime(2024, 1, 1, 12), datetime(2024, 1, 2, 12)
+
+    async def run():
+        await monitor.log_async({"a": 1}, event_time=first)
+        await monitor.log_async({"a": 2}, event_time=first)
+        await monitor.log_async({"a": 3}, event_time=second)
+        await monitor.aclose()
+
+    asyncio.run(run())
+
+    assert [(p["event_time"], p["features"]) for p in _payloads(server)] == [
+        (first.isoformat(), [{"a": 1}, {"a": 2}]),
+        (second.isoformat(), [{"a": 3}]),
+    ]
+
+
+def test_flush_sends_without_waiting_for_the_interval(server):
+    monitor = _monitor(server, batch_size=1000, flush_interval=30)
+
+    async def run():
+        await monitor.log_async({"a": 1})
+        start = time.monotonic()
+        await monitor.flush()
+        elapsed = time.monotonic() - start
+        delivered = list(server.rows())
+        await monitor.aclose()
+        return delivered, elapsed
+
+    delivered, elapsed = asyncio.run(run())
+    assert delivered == [{"a": 1}]
+    assert elapsed < 5
+
+
+def test_aclose_delivers_buffered_rows_and_resets(server):
+    monitor = _monitor(server, batch_size=1000, flush_interval=30)
+
+    async def run():
+        await monitor.log_async([{"a": 1}, {"a": 2}])
+        start = time.monotonic()
+        await monitor.aclose()
+        assert time.monotonic() - start < 5
+        assert monitor._flusher is None and monitor._async_client is None
+        # Safe to call again once closed
+        await monitor.aclose()
+
+    asyncio.run(run())
+
+    assert server.rows() == [{"a": 1}, {"a": 2}]
+
+
+def test_dataframes_with_different_event_times_stay_separate(server):
+    monitor = _monitor(server, batch_size=10, flush_interval=30)
+    frame = pd.DataFrame({"a": [1.0, 2.0], "b": [3, 4]})
+    first, second = datetime(2024, 1, 1, 12), datetime(2024, 1, 2, 12)
+
+    async def run():
+        await monitor.log_async(frame, event_time=first)
+        await monitor.log_async(frame, event_time=first)
+        await monitor.log_async(frame, event_time=second)
+        await monitor.aclose()
+
+    asyncio.run(run())
+
+    assert [(p["event_time"], p["columns"]) for p in _payloads(server)] == [
+        (first.isoformat(), {"a": [1.0, 2.0, 1.0, 2.0], "b": [3, 4, 3, 4]}),
+        (second.isoformat(), {"a": [1.0, 2.0], "b": [3, 4]}),
+    ]
@@ -0,0 +1,107 @@
+import threading
+import time
+
+from watchtower.monitor import WatchtowerInputMonitor
+
+
+def _monitor(server, **kwargs):
+    return WatchtowerInputMonitor("proj", api_key="key", endpoint=server.endpoint, use_arrow=False, **kwargs)
+
+
+def test_log_background_sends_when_batch_size_reached(server):
+    monitor = _monitor(server, batch_size=3, flush_interval=30)
+
+    for i in range(3):
+        monitor.log_background({"a": i})
+
+    requests = server.wait_for(1)
+    assert [payload["features"] for _, payload in requests] == [[{"a": 0}, {"a": 1}, {"a": 2}]]
+    monitor.close()
+
+
+def test_log_background_sends_after_flush_interval(server):
+    monitor = _monitor(server, batch_size=1000, flush_interval=0.2)
+
+    start = time.monotonic()
+    monitor.log_background({"a": 1})
+
+    requests = server.wait_for(1)
+    assert requests[0][1]["features"] == [{"a": 1}]
+    assert time.monotonic() - start < 5
+    monitor.close()
+
+
+def test_log_background_sends_on_caller_thread_when_queue_full(server):
+    monitor = _monitor(server, batch_size=1, flush_interval=0, max_queued=1)
+    server.gate.clear()
+
+    monitor.log_background({"gate": 1})
+    server.wait_for(1)  # the sender is now blocked on this request
+    monitor.log_background({"a": "queued"})
+    monitor.log_background({"a": "direct"})  # queue full: posted synchronously
+
+    assert server.rows() == [{"gate": 1}, {"a": "direct"}]
+    server.gate.set()
+    monitor.close()
+    assert server.rows() == [{"gate": 1}, {"a": "direct"}, {"a": "queued"}]
+
+
+def test_close_delivers_buffered_rows_and_stops_sender(server):
+    monitor = _monitor(server, batch_size=1000, flush_interval=30)
+
+    monitor.log_background([{"a": 1}, {"a": 2}])
+    sender = monitor._thread
+    monitor.close()
+
+    assert server.rows() == [{"a": 1}, {"a": 2}]
+    assert not sender.is_alive()
+    assert monitor._thread is None
+
+    # A later call starts a new sender
+    monitor.log_background({"a": 3})
+    monitor.close()
+    assert server.rows()[-1] == {"a": 3}
+
+
+def test_flush_background_sends_without_waiting_for_the_interval(server):
+    monitor = _monitor(server, batch_size=1000, flush_interval=30)
+
+    monitor.log_background({"a": 1})
+    start = time.monotonic()
+    monitor.flush_background()
+
+    assert time.monotonic() - start < 5
+    assert server.rows() == [{"a": 1}]
+    monitor.close()
+
+
+class _CloseAfterRelease:
+    """Stand-in for _thread_lock that runs close() on another thread right after
+    the calling thread's first release, i.e. in the window a racing close() hits."""
+
+    def __init__(self, monitor):
+        self._lock = threading.Lock()
+        self._monitor = monitor
+        self._caller = threading.current_thread()
+        self._armed = True
+
+    def __enter__(self):
+        self._lock.acquire()
+
+    def __exit__(self, *exc):
+        self._lock.release()
+        if self._armed and threading.current_thread() is self._caller:
+            self._armed = False
+            closer = threading.Thread(target=self._monitor.close)
+            closer.start()
+            closer.join()
+
+
+def test_close_racing_log_background_keeps_the_row(server):
+    monitor = _monitor(server, batch_size=1000, flush_interval=30)
+    monitor._thread_lock = _CloseAfterRelease(monitor)
+
+    monitor.log_background({"a": 1})
+
+    assert server.rows() == [{"a": 1}]
+    assert monitor._thread is None
@@ -0,0 +1,98 @@
+import json
+
+import numpy as np
+import orjson
+import pandas as pd
+import pytest
+
+from watchtower.client import _dumps
+from watchtower.exceptions import WatchtowerSDKError
+from watchtower.monitor import WatchtowerInputMonitor
+from watchtower.serializer import (
+    serialize_arrow, serialize_columns, serialize_features, serialize_features_for_send,
+)
+
+
+def _nullable_frame():
+    return pd.DataFrame({
+        "name": pd.array(["a", None], dtype="string"),
+        "flag": pd.array([True, None], dtype="boolean"),
+        "count": pd.array([1, None], dtype="Int64"),
+        "obj": pd.Series(["x", pd.NA], dtype=object),
+    })
+
+
+def test_serialize_columns_nullable_dtypes():
+    columns = serialize_columns(_nullable_frame())
+
+    assert columns == {
+        "name": ["a", None],
+        "flag": [True, None],
+        "count": [1, None],
+        "obj": ["x", None],
+    }
+    assert orjson.loads(_dumps({"columns": columns}))["columns"] == columns
+
+
+def test_serialize_features_nullable_dtypes():
+    records = serialize_features(_nullable_frame())
+
+    assert records == [
+        {"name": "a", "flag": True, "count": 1, "obj": "x"},
+        {"name": None, "flag": None, "count": None, "obj": None},
+    ]
+    assert orjson.loads(_dumps({"features": records}))["features"] == records
+
+
+def test_serialize_features_single_nullable_dtype():
+    frame = pd.DataFrame({"a": pd.array([1, None], dtype="Int64"), "b": pd.array([None, 2], dtype="Int64")})
+
+    assert serialize_features(frame) == [{"a": 1, "b": None}, {"a": None, "b": 2}]
+
+
+def test_serialize_features_series_with_na():
+    series = pd.Series({"a": pd.NA, "b": 1.5, "c": np.inf}, dtype=object)
+
+    records = serialize_features(series)
+
+    assert orjson.loads(_dumps({"features": records}))["features"] == [{"a": None, "b": 1.5, "c": None}]
+
+
+def test_serialize_features_masks_non_finite_floats():
+    features = {"a": np.nan, "b": np.inf, "c": -np.inf, "d": 1.5, "e": "x"}
+
+    assert serialize_features(features) == [{"a": None, "b": None, "c": None, "d": 1.5, "e": "x"}]
+    assert serialize_features([1.0, np.nan]) == [1.0, None]
+
+
+def test_serialize_features_returns_python_scalars():
+    features = {"i": np.int64(3), "f": np.float32(1.5), "n": np.float64("nan"), "b": np.bool_(True)}
+
+    records = serialize_features(features)
+
+    assert records == [{"i": 3, "f": 1.5, "n": None, "b": True}]
+    assert [type(v) for v in records[0].values()] == [int, float, type(None), bool]
+    json.dumps(records, allow_nan=False)
+
+
+def test_serialize_features_for_send_encodes_like_serialize_features():
+    features = [{"a": np.nan, "b": np.inf, "c": np.float32(2.5), "d": np.int64(4), "e": [1.0, np.nan]}]
+
+    assert orjson.loads(_dumps(serialize_features_for_send(features))) == serialize_features(features)
+
+
+def test_serialize_arrow_metadata_with_numpy_scalars():
+    pa = pytest.importorskip("pyarrow")
+    metadata = {"metadata": {"n": np.int64(3), "x": np.float32(1.5)}}
+
+    body = serialize_arrow(pd.DataFrame({"a": [1.0]}), metadata)
+
+    stored = pa.ipc.open_stream(body).schema.metadata[b"watchtower"]
+    assert orjson.loads(stored) == {"metadata": {"n": 3, "x": 1.5}}
+
+
+def test_log_unencodable_metadata_raises_sdk_error(server):
+    monitor = WatchtowerInputMonitor("proj", api_key="key", endpoint=server.endpoint)
+
+    with pytest.raises(WatchtowerSDKError):
+        monitor.log(pd.DataFrame({"a": [1.0]}), metadata={"m": object()})
@@ -1,15 +1,56 @@
 import os
+import gzip
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .exceptions import WatchtowerSDKError
 
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:  # HTTP/2 is optional (pip install watchtower-sdk[http2])
+    _HTTP2_AVAILABLE = False
+
+
+# Bodies above this size are gzipped; record lists repeat the same keys and shrink several-fold
+GZIP_MIN_BYTES = 4096
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+
+
+def _dumps(payload: dict) -> bytes:
+    """Encode a request body with orjson (numpy scalars and non-str keys allowed, as with json=)."""
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def _encode(payload: dict, compress: bool):
+    """Request body and extra headers: orjson, gzipped (fast level) when large."""
+    body = _dumps(payload)
+    if compress and len(body) > GZIP_MIN_BYTES:
+        return gzip.compress(body, compresslevel=1), _GZIP_HEADERS
+    return body, None
+
 
 class HTTPClient:
     """
     HTTP client for communicating with Watchtower API.
     Handles authentication and error management.
     """
+
+    __slots__ = (
+        "api_key", "endpoint", "timeout", "connect_timeout", "compress",
+        "_timeouts", "_urls", "_session"
+    )
     
-    def __init__(self, api_key: str = None, endpoint: str = None, timeout: int = 30):
+    def __init__(
+        self,
+        api_key: str = None,
+        endpoint: str = None,
+        timeout: int = 30,
+        connect_timeout: float = 3.0,
+        compress: bool = True
+    ):
         """
         Initialize HTTP client.
         
@@ -17,14 +58,43 @@ class HTTPClient:
             api_key: API key for authentication (optional if WATCHTOWER_API_KEY env var set)
             endpoint: Base URL for the API (optional if WATCHTOWER_API_URL env var set)
             timeout: Request timeout in seconds (default: 30)
+            connect_timeout: Connection setup timeout in seconds (default: 3.0)
+            compress: gzip request bodies larger than GZIP_MIN_BYTES (default: True)
         """
         self.api_key = api_key or os.environ.get("WATCHTOWER_API_KEY")
         self.endpoint = endpoint or os.environ.get("WATCHTOWER_API_URL", "http://localhost:8000")
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.compress = compress
         
         if not self.api_key:
             raise WatchtowerSDKError("API Key is required. Pass it to init or set WATCHTOWER_API_KEY env var.")
 
+        # Built once; monitors post to the same few paths on every log() call
+        self._timeouts = (connect_timeout, timeout)
+        self._urls = {}
+
+        # Persistent session: keeps TCP/TLS connections alive across log() calls
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        # Only retry failures where the server did not process the request
+        # (connection errors, 429, 503) since ingestion POSTs are not idempotent.
+        # read=0: a read error or timeout may follow a committed ingest
+        retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=[429, 503],
+            allowed_methods=None,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
     def post(self, path: str, payload: dict) -> dict:
         """
         Send POST request to API endpoint.
@@ -39,18 +109,38 @@ class HTTPClient:
         Raises:
             WatchtowerSDKError: If request fails
         """
-        url = f"{self.endpoint}{path}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        body, headers = _encode(payload, self.compress)
+        return self._send(path, body, headers)
+
+    def post_binary(self, path: str, body: bytes, content_type: str) -> dict:
+        """
+        Send a pre-encoded (non-JSON) body to API endpoint.
+        
+        Args:
+            path: Endpoint path
+            body: Request body bytes
+            content_type: MIME type of `body`
+            
+        Returns:
+            dict: JSON response from server
+            
+        Raises:
+            WatchtowerSDKError: If request fails
+        """
+        return self._send(path, body, {"Content-Type": content_type})
+
+    def _send(self, path: str, body: bytes, headers) -> dict:
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = f"{self.endpoint}{path}"
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 url,
-                json=payload,
+                data=body,
                 headers=headers,
-                timeout=self.timeout
+                # Fail fast on an unreachable server; the read timeout covers slow ingestion
+                timeout=self._timeouts
             )
             resp.raise_for_status()
             return resp.json()
@@ -73,3 +163,99 @@ class HTTPClient:
             
         except requests.exceptions.RequestException as e:
             raise WatchtowerSDKError(f"Request failed: {str(e)}")
+
+
+class AsyncHTTPClient:
+    """
+    Non-blocking HTTP client for communicating with Watchtower API.
+    Same authentication and error handling as HTTPClient, on httpx.AsyncClient.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        endpoint: str = None,
+        timeout: int = 30,
+        max_connections: int = 8,
+        connect_timeout: float = 3.0,
+        compress: bool = True,
+        http2: bool = True
+    ):
+        """
+        Initialize async HTTP client.
+
+        Args:
+            api_key: API key for authentication (optional if WATCHTOWER_API_KEY env var set)
+            endpoint: Base URL for the API (optional if WATCHTOWER_API_URL env var set)
+            timeout: Request timeout in seconds (default: 30)
+            max_connections: Connection pool size (default: 8)
+            connect_timeout: Connection setup timeout in seconds (default: 3.0)
+            compress: gzip request bodies larger than GZIP_MIN_BYTES (default: True)
+            http2: negotiate HTTP/2 with https endpoints when h2 is installed (default: True)
+        """
+        self.api_key = api_key or os.environ.get("WATCHTOWER_API_KEY")
+        self.endpoint = endpoint or os.environ.get("WATCHTOWER_API_URL", "http://localhost:8000")
+        self.timeout = timeout
+        self.compress = compress
+
+        if not self.api_key:
+            raise WatchtowerSDKError("API Key is required. Pass it to init or set WATCHTOWER_API_KEY env var.")
+
+        self._client = httpx.AsyncClient(
+            base_url=self.endpoint,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            },
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            # HTTP/2 multiplexes concurrent posts over one TLS connection
+            http2=http2 and _HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+
+    async def post(self, path: str, payload: dict) -> dict:
+        """
+        Send POST request to API endpoint without blocking the event loop.
+
+        Args:
+            path: Endpoint path
+            payload: Request payload dictionary
+
+        Returns:
+            dict: JSON response from server
+
+        Raises:
+            WatchtowerSDKError: If request fails
+        """
+        try:
+            body, headers = _encode(payload, self.compress)
+            resp = await self._client.post(path, content=body, headers=headers)
+            resp.raise_for_status()
+            return resp.json()
+
+        except httpx.TimeoutException:
+            # The client resolves `path` against base_url; the full URL is only needed here
+            raise WatchtowerSDKError(f"Request timeout after {self.timeout}s: {self.endpoint}{path}")
+
+        except httpx.ConnectError as e:
+            raise WatchtowerSDKError(f"Connection error: {str(e)}")
+
+        except httpx.HTTPStatusError as e:
+            # Include response details for debugging
+            error_msg = f"HTTP {e.response.status_code}: {e.response.reason_phrase}"
+            try:
+                error_detail = e.response.json()
+                error_msg += f" | {error_detail}"
+            except:
+                error_msg += f" | {e.response.text}"
+            raise WatchtowerSDKError(error_msg)
+
+        except httpx.HTTPError as e:
+            raise WatchtowerSDKError(f"Request failed: {str(e)}")
+
+    async def aclose(self):
+        """Close pooled connections."""
+        await self._client.aclose()
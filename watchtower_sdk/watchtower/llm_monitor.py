@@ -2,6 +2,7 @@
 Watchtower LLM Monitor SDK - Client-side class for logging LLM interactions
 """
 from .client import HTTPClient
+from .serializer import serialize_event_time
 from .exceptions import WatchtowerSDKError
 from datetime import datetime
 
@@ -31,7 +32,8 @@ class WatchtowerLLMMonitor:
         self,
         input_text: str,
         response_text: str,
-        metadata: dict = None
+        metadata: dict = None,
+        event_time: datetime = None
     ) -> dict:
         """
         Log an LLM interaction.
@@ -40,6 +42,8 @@ class WatchtowerLLMMonitor:
             input_text: Input text sent to the LLM
             response_text: Response received from the LLM
             metadata: Optional metadata dictionary
+            event_time: Event timestamp (default: current UTC time). Pass one
+                timestamp when logging many interactions in a loop.
             
         Returns:
             dict: Response from backend with logged interaction details
@@ -57,7 +61,7 @@ class WatchtowerLLMMonitor:
             "project_name": self.project_name,
             "input_text": input_text,
             "response_text": response_text,
-            "event_time": datetime.utcnow().isoformat(),
+            "event_time": serialize_event_time(event_time),
             "metadata": metadata or {}
         }
 
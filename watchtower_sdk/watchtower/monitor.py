@@ -1,15 +1,48 @@
-from .client import HTTPClient
-from .serializer import serialize_features
+import asyncio
+import queue
+import threading
+import time
+import warnings
+from .client import HTTPClient, AsyncHTTPClient
+from .serializer import serialize_features_for_send, serialize_columns, serialize_event_time, serialize_arrow, is_dataframe, ARROW_CONTENT_TYPE
 from .exceptions import WatchtowerSDKError
 from datetime import datetime
 
+# Queued by flush(): the sender stops waiting for more rows and sends what it has
+_FLUSH = object()
+
 class WatchtowerInputMonitor:
     """
     Main SDK object for data monitoring.
     Handles logging features to Watchtower AI backend for validation and drift detection.
     """
 
-    def __init__(self, project_name: str, api_key: str = None, endpoint: str = None):
+    __slots__ = (
+        "project_name", "api_key", "endpoint", "client", "use_arrow",
+        "batch_size", "flush_interval", "_async_client", "_queue", "_flusher",
+        "max_queued", "_thread_client", "_thread_queue", "_thread", "_thread_lock"
+    )
+
+    def __init__(
+        self,
+        project_name: str,
+        api_key: str = None,
+        endpoint: str = None,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queued: int = 10000,
+        use_arrow: bool = True
+    ):
+        """
+        Args:
+            project_name: Name of the project
+            api_key: API key (optional if WATCHTOWER_API_KEY env var set)
+            endpoint: Base URL of Watchtower API (optional if WATCHTOWER_API_URL env var set)
+            batch_size: log_async / log_background send once this many rows are buffered
+            flush_interval: log_async / log_background send buffered rows at most this many seconds after the first
+            max_queued: log_background sends on the caller's thread once this many calls are waiting
+            use_arrow: log() sends DataFrames as Arrow IPC when pyarrow is installed (default: True)
+        """
         self.project_name = project_name
         self.api_key = api_key
         
@@ -22,6 +55,21 @@ class WatchtowerInputMonitor:
             self.endpoint = self.endpoint.rstrip("/")
             
         self.client = HTTPClient(api_key=self.api_key, endpoint=self.endpoint, timeout=60)
+        self.use_arrow = use_arrow
+
+        # Async batching state, created on first log_async() inside the running loop
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._async_client = None
+        self._queue = None
+        self._flusher = None
+
+        # Background-thread batching state, started on first log_background()
+        self.max_queued = max_queued
+        self._thread_client = None
+        self._thread_queue = None
+        self._thread = None
+        self._thread_lock = threading.Lock()
 
     def log(
         self,
@@ -42,35 +90,280 @@ class WatchtowerInputMonitor:
         if features is None:
             raise WatchtowerSDKError("Features cannot be None")
 
-        # Handle event_time serialization
-        if event_time is None:
-            event_time_str = datetime.utcnow().isoformat()
-        elif isinstance(event_time, datetime):
-            event_time_str = event_time.isoformat()
-        else:
-            event_time_str = str(event_time)
-
         payload = {
             "project_name": self.project_name,
-            "event_time": event_time_str,
-            "features": serialize_features(features),
+            "event_time": serialize_event_time(event_time),
             "stage": stage,
             "metadata": metadata or {}
         }
+        # DataFrames go as Arrow when possible, else column-oriented JSON:
+        # no per-row dicts, keys sent once
+        body = None
+        if is_dataframe(features):
+            if self.use_arrow:
+                body = serialize_arrow(features, payload)
+            if body is None:
+                payload["columns"] = serialize_columns(features)
+        else:
+            payload["features"] = serialize_features_for_send(features)
 
         # Send data to backend
         try:
+            if body is not None:
+                return self.client.post_binary("/ingest/arrow", body, ARROW_CONTENT_TYPE)
             response = self.client.post("/ingest", payload)
             return response
         except Exception as e:
             raise WatchtowerSDKError(f"Failed to log data: {e}")
 
+    async def log_async(
+        self,
+        features,
+        stage: str = "model_input",
+        event_time: datetime = None,
+        metadata: dict = None
+    ):
+        """
+        Queue feature data for monitoring without waiting on the network.
+        Rows are buffered and sent in one /ingest request per `batch_size` rows
+        or `flush_interval` seconds, whichever comes first. Call `flush()` or
+        `aclose()` before exiting so buffered rows are delivered.
+
+        Args:
+            features: Feature data (dict, list, DataFrame, etc.)
+            stage: Monitoring stage (default: "model_input")
+            event_time: Event timestamp (default: current UTC time)
+            metadata: Additional metadata (optional)
+        """
+        item = self._queue_item(features, stage, event_time, metadata)
+
+        if self._flusher is None:
+            self._async_client = AsyncHTTPClient(api_key=self.api_key, endpoint=self.endpoint, timeout=60)
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+        await self._queue.put(item)
+
+    def _queue_item(self, features, stage, event_time, metadata):
+        if features is None:
+            raise WatchtowerSDKError("Features cannot be None")
+
+        # DataFrames stay column-oriented so batching never builds per-row dicts
+        if is_dataframe(features):
+            data = serialize_columns(features)
+            n_rows = len(features)
+        else:
+            data = serialize_features_for_send(features)
+            if isinstance(data, dict):
+                data = [data]
+            n_rows = len(data)
+        # The last element marks an explicit event_time, which batching must keep
+        return stage, serialize_event_time(event_time), metadata or {}, data, n_rows, event_time is not None
+
+    async def _flush_loop(self):
+        """Background task: collect queued rows into batches and send them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _FLUSH:
+                self._queue.task_done()
+                continue
+            batch = [item]
+            n_rows = item[4]
+            deadline = loop.time() + self.flush_interval
+            while n_rows < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _FLUSH:
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+                n_rows += item[4]
+
+            try:
+                await self._send_batch(batch)
+            except Exception as e:
+                # Nobody awaits the background task, so report instead of raising
+                warnings.warn(f"Failed to log data: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _batch_payloads(self, batch):
+        # Consecutive calls with the same stage, metadata and event time share one
+        # request; a payload carries a single event_time, so calls that passed one
+        # explicitly only merge with calls that passed the same one, while calls
+        # using the default (time of the call) merge with each other.
+        # DataFrame columns are concatenated when their names match
+        group = None
+        group_time = None
+        for stage, event_time_str, metadata, data, _, explicit_time in batch:
+            key = "columns" if isinstance(data, dict) else "features"
+            item_time = event_time_str if explicit_time else None
+            if (
+                group is not None and group_time == item_time
+                and group["stage"] == stage and group["metadata"] == metadata
+                and key in group and (key == "features" or group[key].keys() == data.keys())
+            ):
+                if key == "features":
+                    group[key].extend(data)
+                else:
+                    for col, values in data.items():
+                        group[key][col].extend(values)
+                continue
+            if group is not None:
+                yield group
+            group_time = item_time
+            group = {
+                "project_name": self.project_name,
+                "event_time": event_time_str,
+                key: list(data) if key == "features" else {col: list(v) for col, v in data.items()},
+                "stage": stage,
+                "metadata": metadata
+            }
+        yield group
+
+    async def _send_batch(self, batch):
+        for payload in self._batch_payloads(batch):
+            await self._async_client.post("/ingest", payload)
+
+    async def flush(self):
+        """Send every row queued by log_async now and wait until it has been sent."""
+        if self._queue is not None:
+            await self._queue.put(_FLUSH)
+            await self._queue.join()
+
+    async def aclose(self):
+        """Flush buffered rows, then stop the background sender and close connections."""
+        if self._flusher is None:
+            return
+        await self.flush()
+        self._flusher.cancel()
+        await self._async_client.aclose()
+        self._async_client = self._queue = self._flusher = None
+
+    def log_background(
+        self,
+        features,
+        stage: str = "model_input",
+        event_time: datetime = None,
+        metadata: dict = None
+    ):
+        """
+        Queue feature data for monitoring and return immediately (for synchronous code).
+        A daemon thread sends rows in one /ingest request per `batch_size` rows
+        or `flush_interval` seconds, whichever comes first. If `max_queued`
+        calls are already waiting, this call sends on the caller's thread
+        instead. Call `flush_background()` or `close()` before exiting so
+        buffered rows are delivered.
+
+        Args:
+            features: Feature data (dict, list, DataFrame, etc.)
+            stage: Monitoring stage (default: "model_input")
+            event_time: Event timestamp (default: current UTC time)
+            metadata: Additional metadata (optional)
+        """
+        item = self._queue_item(features, stage, event_time, metadata)
+
+        # Enqueue under the lock so close() can't put its sentinel (or drop the
+        # queue) between the sender check and the put
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                # The sender gets its own client: requests.Session isn't shared across threads
+                self._thread_client = HTTPClient(api_key=self.api_key, endpoint=self.endpoint, timeout=60)
+                self._thread_queue = queue.Queue(maxsize=self.max_queued)
+                self._thread = threading.Thread(target=self._thread_loop, name="watchtower-sender", daemon=True)
+                self._thread.start()
+            try:
+                self._thread_queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+
+        # Sender is backed up: send on the caller's thread instead
+        try:
+            for payload in self._batch_payloads([item]):
+                self.client.post("/ingest", payload)
+        except Exception as e:
+            raise WatchtowerSDKError(f"Failed to log data: {e}")
+
+    def _thread_loop(self):
+        """Background thread: collect queued rows into batches and send them."""
+        q = self._thread_queue
+        while True:
+            item = q.get()
+            if item is None:
+                q.task_done()
+                return
+            if item is _FLUSH:
+                q.task_done()
+                continue
+            batch = [item]
+            n_rows = item[4]
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while n_rows < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                if item is _FLUSH:
+                    q.task_done()
+                    break
+                batch.append(item)
+                n_rows += item[4]
+
+            try:
+                for payload in self._batch_payloads(batch):
+                    self._thread_client.post("/ingest", payload)
+            except Exception as e:
+                # Nobody joins the sender thread, so report instead of raising
+                warnings.warn(f"Failed to log data: {e}")
+            finally:
+                for _ in batch:
+                    q.task_done()
+            if stop:
+                q.task_done()
+                return
+
+    def flush_background(self):
+        """Send every row queued by log_background now and block until it has been sent."""
+        with self._thread_lock:
+            q = self._thread_queue
+            if q is None:
+                return
+            # Under the lock so the marker can't land behind close()'s sentinel
+            q.put(_FLUSH)
+        q.join()
+
+    def close(self):
+        """Flush rows queued by log_background, then stop the sender thread."""
+        with self._thread_lock:
+            if self._thread is None:
+                return
+            self._thread_queue.put(None)
+            self._thread.join()
+            self._thread_client = self._thread_queue = self._thread = None
+
 
 class WatchtowerModelMonitor:
     """
     SDK object for model prediction & metric monitoring.
     """
 
+    __slots__ = ("project_name", "api_key", "endpoint", "model_type", "client", "_async_client")
+
     def __init__(self, project_name: str, api_key: str = None, endpoint: str = None, model_type: str = None):
         self.project_name = project_name
         self.api_key = api_key
@@ -80,6 +373,8 @@ class WatchtowerModelMonitor:
             
         self.model_type = model_type  # "classification" or "regression"
         self.client = HTTPClient(api_key=self.api_key, endpoint=self.endpoint)
+        # Created on first log_async() so it binds to the running loop
+        self._async_client = None
 
     def log(
         self,
@@ -113,44 +408,76 @@ class WatchtowerModelMonitor:
             rmse: Root Mean Squared Error
             r2_score: R-squared score
         """
+        payload = self._payload(
+            predictions, metadata,
+            accuracy=accuracy, precision=precision, recall=recall,
+            f1_score=f1_score, roc_auc=roc_auc,
+            mae=mae, mse=mse, rmse=rmse, r2_score=r2_score
+        )
+
+        try:
+            # We use a new endpoint for predictions/metrics
+            response = self.client.post("/ingest/predictions", payload)
+            return response
+        except Exception as e:
+            raise WatchtowerSDKError(f"Failed to log model data: {e}")
+
+    async def log_async(
+        self,
+        predictions,
+        metadata: dict = None,
+        # Classification metrics
+        accuracy: float = None,
+        precision: float = None,
+        recall: float = None,
+        f1_score: float = None,
+        roc_auc: float = None,
+        # Regression metrics
+        mae: float = None,
+        mse: float = None,
+        rmse: float = None,
+        r2_score: float = None
+    ):
+        """
+        Send predictions and/or metrics without blocking the event loop.
+        Takes the same arguments as `log()`. Requests share one pooled
+        connection (HTTP/2 when available); call `aclose()` on shutdown.
+        """
+        payload = self._payload(
+            predictions, metadata,
+            accuracy=accuracy, precision=precision, recall=recall,
+            f1_score=f1_score, roc_auc=roc_auc,
+            mae=mae, mse=mse, rmse=rmse, r2_score=r2_score
+        )
+
+        if self._async_client is None:
+            self._async_client = AsyncHTTPClient(api_key=self.api_key, endpoint=self.endpoint, timeout=10)
+
+        try:
+            return await self._async_client.post("/ingest/predictions", payload)
+        except Exception as e:
+            raise WatchtowerSDKError(f"Failed to log model data: {e}")
+
+    async def aclose(self):
+        """Close the connections opened by log_async."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _payload(self, predictions, metadata, **metrics):
+        """Build the /ingest/predictions body shared by log() and log_async()."""
         # Serialize predictions
-        serialized_preds = serialize_features(predictions)
-        
-        # Construct metrics dictionary from explicit arguments
-        metrics = {
-            "accuracy": accuracy,
-            "precision": precision,
-            "recall": recall,
-            "f1_score": f1_score,
-            "roc_auc": roc_auc,
-            "mae": mae,
-            "mse": mse,
-            "rmse": rmse,
-            "r2_score": r2_score
-        }
-        # Filter out None values
-        metrics = {k: v for k, v in metrics.items() if v is not None}
-        
-        # Serialize metrics just in case (e.g. numpy floats)
-        serialized_metrics = {}
-        if metrics:
-            serialized_metrics = serialize_features(metrics)
-            # serialize_features returns a list of dicts for dict input, slice index 0
-            if isinstance(serialized_metrics, list) and len(serialized_metrics) > 0:
-                serialized_metrics = serialized_metrics[0]
+        serialized_preds = serialize_features_for_send(predictions)
 
-        payload = {
+        # Filter out None values. The remaining scalars (Python or numpy floats,
+        # NaN included) are encoded directly by the client's orjson encoder
+        serialized_metrics = {k: v for k, v in metrics.items() if v is not None}
+
+        return {
             "project_name": self.project_name,
-            "event_time": datetime.utcnow().isoformat(),
+            "event_time": serialize_event_time(),
             "predictions": serialized_preds,
             "metrics": serialized_metrics,
             "model_type": self.model_type,
             "metadata": metadata or {}
         }
-
-        try:
-            # We use a new endpoint for predictions/metrics
-            response = self.client.post("/ingest/predictions", payload)
-            return response
-        except Exception as e:
-            raise WatchtowerSDKError(f"Failed to log model data: {e}")
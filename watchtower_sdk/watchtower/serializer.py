@@ -1,35 +1,292 @@
-import pandas as pd
+import sys
 import numpy as np
-import math
+import time
+from datetime import datetime, timezone
+from .client import _dumps
 
-def _sanitize(obj):
-    """Recursively convert NaN/Inf values to None for JSON compliance."""
-    if isinstance(obj, dict):
-        return {k: _sanitize(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_sanitize(v) for v in obj]
-    elif isinstance(obj, float):
-        if math.isnan(obj) or math.isinf(obj):
-            return None
-        return obj
-    elif isinstance(obj, np.generic):
-        # Handle numpy types
-        if np.isnan(obj):
-            return None
-        return obj.item() if hasattr(obj, 'item') else obj
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+# pyarrow module once imported, False if it isn't installed
+_pa = None
+
+def _pandas():
+    """
+    The pandas module if it has been imported, else None. A DataFrame or
+    Series can only exist once the caller has imported pandas, so numpy,
+    list and dict callers never pay for loading it.
+    """
+    return sys.modules.get("pandas")
+
+def _pyarrow():
+    """pyarrow, imported on first Arrow upload; None if it isn't installed."""
+    global _pa
+    if _pa is None:
+        try:
+            import pyarrow
+            _pa = pyarrow
+        except ImportError:  # Arrow uploads are optional (pip install watchtower-sdk[arrow])
+            _pa = False
+    return _pa or None
+
+def is_dataframe(obj) -> bool:
+    """True if `obj` is a pandas DataFrame (without importing pandas)."""
+    pd = _pandas()
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+# Values that need no conversion; containers holding only these are copied
+# in one C-level call (floats masked in the same pass) instead of visiting
+# every value through the handler table.
+_CLEAN_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_INF = float("inf")
+_NINF = float("-inf")
+
+def _san_dict(obj):
+    types = set(map(type, obj.values()))
+    if _CLEAN_TYPES.issuperset(types):
+        if float not in types:
+            return dict(obj)
+        # NaN is the one value unequal to itself; for the other clean types
+        # these comparisons are simply False
+        return {k: None if v != v or v == _INF or v == _NINF else v for k, v in obj.items()}
+    return {k: _sanitize(v) for k, v in obj.items()}
+
+def _san_list(obj):
+    types = set(map(type, obj))
+    if _CLEAN_TYPES.issuperset(types):
+        if float not in types:
+            return list(obj)
+        return [None if v != v or v == _INF or v == _NINF else v for v in obj]
+    return [_sanitize(v) for v in obj]
+
+def _san_float(obj):
+    if obj != obj or obj == _INF or obj == _NINF:
+        return None
+    return obj
+
+def _san_numpy(obj):
+    # Python value for a numpy scalar; NaN/Inf and NaT become None
+    if isinstance(obj, np.floating) and not np.isfinite(obj):
+        return None
+    if isinstance(obj, np.datetime64) and np.isnat(obj):
+        return None
+    return obj.item()
+
+def _san_identity(obj):
     return obj
 
+# For bodies the SDK encodes itself with client._dumps: orjson writes NaN/Inf
+# as null, so plain floats need no check and clean containers are just copied
+def _san_dict_for_send(obj):
+    if _CLEAN_TYPES.issuperset(map(type, obj.values())):
+        return dict(obj)
+    return {k: _sanitize_for_send(v) for k, v in obj.items()}
+
+def _san_list_for_send(obj):
+    if _CLEAN_TYPES.issuperset(map(type, obj)):
+        return list(obj)
+    return [_sanitize_for_send(v) for v in obj]
+
+def _san_numpy_for_send(obj):
+    # Numpy scalars the request encoder can't write (e.g. float16, longdouble)
+    if np.isnan(obj):
+        return None
+    return obj.item() if hasattr(obj, 'item') else obj
+
+# Numpy scalars the client's orjson encoder writes itself (NaN/Inf as null),
+# so they are passed through instead of being converted with .item()
+_ORJSON_NUMPY_TYPES = (np.float32, np.float64, np.integer, np.bool_, np.str_, np.datetime64)
+
+# Exact type -> handler, one table per mode. Other types (numpy scalars,
+# subclasses) are resolved through isinstance once and then added here, so
+# each type is dispatched by a single dict lookup from then on.
+_HANDLERS = {
+    dict: _san_dict,
+    list: _san_list,
+    float: _san_float,
+    int: _san_identity,
+    str: _san_identity,
+    bool: _san_identity,
+    type(None): _san_identity,
+}
+_SEND_HANDLERS = {
+    dict: _san_dict_for_send,
+    list: _san_list_for_send,
+    float: _san_identity,
+    int: _san_identity,
+    str: _san_identity,
+    bool: _san_identity,
+    type(None): _san_identity,
+}
+
+def _resolve_handler(cls, for_send: bool):
+    if for_send and issubclass(cls, _ORJSON_NUMPY_TYPES):
+        return _san_identity
+    elif issubclass(cls, dict):
+        return _san_dict_for_send if for_send else _san_dict
+    elif issubclass(cls, list):
+        return _san_list_for_send if for_send else _san_list
+    elif issubclass(cls, float):
+        return _san_float
+    elif issubclass(cls, np.generic):
+        return _san_numpy_for_send if for_send else _san_numpy
+    return _san_identity
+
+def _sanitize(obj):
+    """
+    Recursively copy a payload into JSON-clean values: NaN/Inf floats
+    (Python or numpy) become None and numpy scalars become Python values.
+    """
+    cls = type(obj)
+    handler = _HANDLERS.get(cls)
+    if handler is None:
+        handler = _HANDLERS[cls] = _resolve_handler(cls, False)
+    return handler(obj)
+
+def _sanitize_for_send(obj):
+    """
+    Like _sanitize, for payloads encoded with client._dumps. NaN/Inf floats
+    (Python or numpy) are left for the orjson encoder, which writes them as null.
+    """
+    cls = type(obj)
+    handler = _SEND_HANDLERS.get(cls)
+    if handler is None:
+        handler = _SEND_HANDLERS[cls] = _resolve_handler(cls, True)
+    return handler(obj)
+
+def _column_to_list(values: np.ndarray) -> list:
+    """
+    Convert one column to a list of native Python values with NaN/Inf as None.
+    The dtype is checked once per column, so numeric columns skip per-value sanitization.
+    """
+    kind = values.dtype.kind
+    if kind == "f":
+        out = values.tolist()
+        for i in np.flatnonzero(~np.isfinite(values)):
+            out[i] = None
+    elif kind in "iub":
+        out = values.tolist()
+    elif kind == "M":
+        # tolist() on datetime64[ns] yields raw integers; send ISO strings instead
+        out = np.datetime_as_string(values).tolist()
+        for i in np.flatnonzero(np.isnat(values)):
+            out[i] = None
+    else:
+        out = _sanitize(values.tolist())
+        # Object and nullable extension columns (string, boolean, Int64, ...)
+        # hold pd.NA / None / NaN for missing values, which all become None
+        pd = _pandas()
+        if pd is not None:
+            for i in np.flatnonzero(pd.isna(values)):
+                out[i] = None
+    return out
+
+def _array_to_list(values: np.ndarray) -> list:
+    """Nested list for an array of any shape; NaN/Inf masked in NumPy rather than per value."""
+    kind = values.dtype.kind
+    if kind == "f":
+        mask = ~np.isfinite(values)
+        if mask.any():
+            out = values.astype(object)
+            out[mask] = None
+            return out.tolist()
+        return values.tolist()
+    elif kind in "iub":
+        return values.tolist()
+    return _sanitize(values.tolist())
+
 def serialize_features(features):
-    if isinstance(features, pd.DataFrame):
-        # replace handles NaN in DataFrames
-        return features.replace({np.nan: None, np.inf: None, -np.inf: None}).to_dict(orient="records")
-    elif isinstance(features, pd.Series):
-        return [features.replace({np.nan: None, np.inf: None, -np.inf: None}).to_dict()]
+    """
+    Convert features (DataFrame, Series, ndarray, list or dict) to a list of
+    JSON-clean records: NaN/Inf become None and numpy scalars Python values.
+    """
+    return _serialize_features(features, _sanitize)
+
+def serialize_features_for_send(features):
+    """
+    serialize_features for payloads the SDK encodes itself with client._dumps.
+    Plain floats and numpy scalars in lists and dicts are left for orjson,
+    which writes NaN/Inf as null, so clean containers are copied without a
+    per-value check. Don't encode the result with another JSON encoder.
+    """
+    return _serialize_features(features, _sanitize_for_send)
+
+def _serialize_features(features, sanitize):
+    pd = _pandas()
+    if pd is not None and isinstance(features, pd.DataFrame):
+        columns = list(features.columns)
+        # Single numeric dtype (the usual all-float feature frame): convert the
+        # one 2-D block at once; mixed dtypes would be upcast, so they go per column
+        # (numpy dtypes only: nullable Int64/boolean also report kind "i"/"b"
+        # but convert to object arrays holding pd.NA)
+        dtypes = set(features.dtypes)
+        dtype = dtypes.pop() if len(dtypes) == 1 else None
+        if isinstance(dtype, np.dtype) and dtype.kind in "fiub":
+            return [dict(zip(columns, row)) for row in _array_to_list(features.to_numpy())]
+        # Convert column by column, then zip into records (no full-frame replace() copy)
+        values = [_column_to_list(features.iloc[:, j].to_numpy()) for j in range(len(columns))]
+        if not columns:
+            return [{} for _ in range(len(features))]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+    elif pd is not None and isinstance(features, pd.Series):
+        return [dict(zip(features.index, _column_to_list(features.to_numpy())))]
     elif isinstance(features, (np.ndarray, list, dict)):
         # For other types, use recursive sanitization
         # First convert to standard python types if needed
         if isinstance(features, np.ndarray):
-            return _sanitize(features.tolist())
-        return _sanitize(features if isinstance(features, list) else [features])
+            return _array_to_list(features)
+        return sanitize(features if isinstance(features, list) else [features])
     else:
         raise ValueError("Unsupported features format")
+
+def serialize_columns(df) -> dict:
+    """
+    Column-oriented payload for a DataFrame: {column: [values...]} with NaN/Inf as None.
+    Each column is converted in one tolist() call instead of building a dict per row.
+    """
+    return {
+        str(col): _column_to_list(df.iloc[:, j].to_numpy())
+        for j, col in enumerate(df.columns)
+    }
+
+def serialize_arrow(df, metadata: dict):
+    """
+    Arrow IPC stream (zstd-compressed buffers) for a DataFrame, with `metadata`
+    stored as JSON in the schema under "watchtower". Values keep their dtypes
+    and are never boxed into Python objects.
+    Returns None if pyarrow isn't installed or the frame or metadata can't be
+    converted (e.g. mixed-type object columns); callers then fall back to JSON.
+    """
+    pa = _pyarrow()
+    if pa is None:
+        return None
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # Same encoder options as JSON bodies, so numpy scalars in metadata work here too
+        table = table.replace_schema_metadata({"watchtower": _dumps(metadata)})
+
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression="zstd")
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+    except (pa.ArrowException, ValueError, TypeError):
+        return None
+    return sink.getvalue().to_pybytes()
+
+# (time.time() when formatted, formatted string); calls within 1 ms reuse the string
+_NOW_ISO = [0.0, ""]
+
+def _utcnow_iso() -> str:
+    now = time.time()
+    if now - _NOW_ISO[0] > 0.001:
+        _NOW_ISO[1] = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+        _NOW_ISO[0] = now
+    return _NOW_ISO[1]
+
+def serialize_event_time(event_time=None) -> str:
+    """ISO string for an event timestamp; defaults to the current UTC time (naive, as the server stores it)."""
+    if event_time is None:
+        return _utcnow_iso()
+    elif isinstance(event_time, datetime):
+        return event_time.isoformat()
+    return str(event_time)